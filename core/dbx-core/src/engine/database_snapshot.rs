@@ -5,9 +5,15 @@ use crate::engine::snapshot::{DatabaseSnapshot, TableData};
 use crate::engine::{Database, WosVariant};
 use crate::error::{DbxError, DbxResult};
 use arrow::datatypes::Schema;
-use std::path::Path;
+use std::fs::{self, File};
+use std::io::BufWriter;
+use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
+/// Write buffer size for snapshot files; the JSON is streamed to disk in
+/// chunks of this size instead of being built up as one string first
+const SNAPSHOT_WRITE_BUFFER: usize = 1 << 20;
+
 impl Database {
     /// Save in-memory database to file
     ///
@@ -40,16 +46,40 @@ impl Database {
         // 2. Create snapshot
         let snapshot = self.create_snapshot()?;
 
-        // 3. Serialize to JSON
-        let json = serde_json::to_string_pretty(&snapshot)
-            .map_err(|e| DbxError::Serialization(e.to_string()))?;
+        // 3. Serialize to JSON, streaming it to a temp file next to the
+        //    target so a failed save leaves the previous snapshot intact
+        let path = path.as_ref();
+        let mut tmp_path = path.as_os_str().to_owned();
+        tmp_path.push(".tmp");
+        let tmp_path = PathBuf::from(tmp_path);
+
+        if let Err(e) = Self::write_snapshot(&snapshot, &tmp_path) {
+            let _ = fs::remove_file(&tmp_path);
+            return Err(e);
+        }
 
-        // 4. Write to file
-        std::fs::write(path, json)?;
+        // 4. Atomically replace the old snapshot
+        fs::rename(&tmp_path, path)?;
 
         Ok(())
     }
 
+    /// Stream a snapshot as JSON into a new file and sync it to disk
+    fn write_snapshot(snapshot: &DatabaseSnapshot, path: &Path) -> DbxResult<()> {
+        let file = File::create(path)?;
+        let mut writer = BufWriter::with_capacity(SNAPSHOT_WRITE_BUFFER, file);
+        serde_json::to_writer_pretty(&mut writer, snapshot).map_err(|e| {
+            if e.is_io() {
+                DbxError::from(std::io::Error::from(e))
+            } else {
+                DbxError::Serialization(e.to_string())
+            }
+        })?;
+        let file = writer.into_inner().map_err(|e| e.into_error())?;
+        file.sync_all()?;
+        Ok(())
+    }
+
     /// Load database from file into in-memory database
     ///
     /// Creates a new in-memory DB and loads all data from file.
@@ -70,11 +100,11 @@ impl Database {
     /// ```
     pub fn load_from_file<P: AsRef<Path>>(path: P) -> DbxResult<Self> {
         // 1. Read file
-        let json = std::fs::read_to_string(path)?;
+        let json = fs::read(path)?;
 
-        // 2. Deserialize snapshot
+        // 2. Deserialize snapshot (serde_json validates UTF-8 as it parses)
         let snapshot: DatabaseSnapshot =
-            serde_json::from_str(&json).map_err(|e| DbxError::Serialization(e.to_string()))?;
+            serde_json::from_slice(&json).map_err(|e| DbxError::Serialization(e.to_string()))?;
 
         // 3. Create new in-memory DB
         let db = Self::open_in_memory()?;
@@ -55,6 +55,7 @@ pub const DBX_ERR_INVALID_UTF8: c_int = -2;
 pub const DBX_ERR_DATABASE: c_int = -3;
 pub const DBX_ERR_NOT_FOUND: c_int = -4;
 pub const DBX_ERR_INVALID_OP: c_int = -5;
+pub const DBX_ERR_BUFFER_TOO_SMALL: c_int = -6;
 
 // ═══════════════════════════════════════════════════════════════
 // Constructors
@@ -180,6 +181,57 @@ pub unsafe extern "C" fn dbx_get(
     }
 }
 
+/// Get a value by key, copying it into a caller-owned buffer
+///
+/// The value length is always stored in `out_len` when the key exists. If
+/// it exceeds `buf_cap`, nothing is copied and DBX_ERR_BUFFER_TOO_SMALL is
+/// returned so the caller can retry with a larger buffer.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_get_into(
+    handle: *mut DbxHandle,
+    table: *const c_char,
+    key: *const u8,
+    key_len: usize,
+    buf: *mut u8,
+    buf_cap: usize,
+    out_len: *mut usize,
+) -> c_int {
+    if handle.is_null()
+        || table.is_null()
+        || key.is_null()
+        || out_len.is_null()
+        || (buf.is_null() && buf_cap > 0)
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let handle = &*handle;
+
+    let table_str = match CStr::from_ptr(table).to_str() {
+        Ok(s) => s,
+        Err(_) => return DBX_ERR_INVALID_UTF8,
+    };
+
+    let key_slice = slice::from_raw_parts(key, key_len);
+
+    match handle.db.get(table_str, key_slice) {
+        Ok(Some(value)) => {
+            *out_len = value.len();
+            if value.len() > buf_cap {
+                return DBX_ERR_BUFFER_TOO_SMALL;
+            }
+            // `buf` may be null when `buf_cap` is 0, and a null pointer is
+            // invalid even for a zero-length copy
+            if !value.is_empty() {
+                ptr::copy_nonoverlapping(value.as_ptr(), buf, value.len());
+            }
+            DBX_OK
+        }
+        Ok(None) => DBX_ERR_NOT_FOUND,
+        Err(_) => DBX_ERR_DATABASE,
+    }
+}
+
 /// Delete a key from a table
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn dbx_delete(
@@ -255,6 +307,184 @@ pub unsafe extern "C" fn dbx_insert_batch(
     }
 }
 
+/// View `len` bytes of a packed buffer; `data` may be null when `len` is 0
+unsafe fn packed_bytes<'a>(data: *const u8, len: usize) -> Option<&'a [u8]> {
+    if len == 0 {
+        Some(&[])
+    } else if data.is_null() {
+        None
+    } else {
+        Some(slice::from_raw_parts(data, len))
+    }
+}
+
+/// Insert multiple key-value pairs packed into two contiguous buffers
+///
+/// `key_offsets` and `value_offsets` hold `count + 1` ascending byte
+/// offsets; pair `i` spans `offsets[i]..offsets[i + 1]` of the matching
+/// data buffer. Offset pointers may be null when `count` is 0, and data
+/// pointers whenever their buffer is empty.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_insert_many(
+    handle: *mut DbxHandle,
+    table: *const c_char,
+    count: usize,
+    key_offsets: *const u64,
+    key_data: *const u8,
+    value_offsets: *const u64,
+    value_data: *const u8,
+) -> c_int {
+    if handle.is_null()
+        || table.is_null()
+        || (count > 0 && (key_offsets.is_null() || value_offsets.is_null()))
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let handle = &*handle;
+
+    let table_str = match CStr::from_ptr(table).to_str() {
+        Ok(s) => s,
+        Err(_) => return DBX_ERR_INVALID_UTF8,
+    };
+
+    if count == 0 {
+        return DBX_OK;
+    }
+
+    let key_offsets = slice::from_raw_parts(key_offsets, count + 1);
+    let value_offsets = slice::from_raw_parts(value_offsets, count + 1);
+    if key_offsets.windows(2).any(|w| w[0] > w[1]) || value_offsets.windows(2).any(|w| w[0] > w[1])
+    {
+        return DBX_ERR_INVALID_OP;
+    }
+
+    let (Some(keys), Some(values)) = (
+        packed_bytes(key_data, key_offsets[count] as usize),
+        packed_bytes(value_data, value_offsets[count] as usize),
+    ) else {
+        return DBX_ERR_NULL_PTR;
+    };
+
+    let mut rows = Vec::with_capacity(count);
+    for i in 0..count {
+        let k = &keys[key_offsets[i] as usize..key_offsets[i + 1] as usize];
+        let v = &values[value_offsets[i] as usize..value_offsets[i + 1] as usize];
+        rows.push((k.to_vec(), v.to_vec()));
+    }
+
+    match handle.db.insert_batch(table_str, rows) {
+        Ok(_) => DBX_OK,
+        Err(_) => DBX_ERR_DATABASE,
+    }
+}
+
+/// Look up multiple keys at once and count how many exist
+///
+/// Values are dropped inside the engine instead of being handed back, so
+/// callers pay only for the lookups. `keys` and `key_lens` use the same
+/// layout as `dbx_insert_batch`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_get_many_discard(
+    handle: *mut DbxHandle,
+    table: *const c_char,
+    keys: *const *const u8,
+    key_lens: *const usize,
+    count: usize,
+    out_hits: *mut usize,
+) -> c_int {
+    if handle.is_null()
+        || table.is_null()
+        || keys.is_null()
+        || key_lens.is_null()
+        || out_hits.is_null()
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let handle = &*handle;
+
+    let table_str = match CStr::from_ptr(table).to_str() {
+        Ok(s) => s,
+        Err(_) => return DBX_ERR_INVALID_UTF8,
+    };
+
+    let mut hits = 0;
+    for i in 0..count {
+        let key_slice = slice::from_raw_parts(*keys.add(i), *key_lens.add(i));
+        match handle.db.get(table_str, key_slice) {
+            Ok(Some(_)) => hits += 1,
+            Ok(None) => {}
+            Err(_) => return DBX_ERR_DATABASE,
+        }
+    }
+
+    *out_hits = hits;
+    DBX_OK
+}
+
+/// Look up multiple keys packed into one contiguous buffer
+///
+/// `key_offsets` uses the same layout as `dbx_insert_many`. `out_found`
+/// receives `count` flags (1 if the key exists, 0 otherwise), and the
+/// values of the keys that exist are returned, in key order, as the
+/// values of a DbxScanResult whose keys are left empty.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_get_many(
+    handle: *mut DbxHandle,
+    table: *const c_char,
+    count: usize,
+    key_offsets: *const u64,
+    key_data: *const u8,
+    out_found: *mut u8,
+    out_result: *mut *mut DbxScanResult,
+) -> c_int {
+    if handle.is_null()
+        || table.is_null()
+        || (count > 0 && (key_offsets.is_null() || out_found.is_null()))
+        || out_result.is_null()
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let handle = &*handle;
+
+    let table_str = match CStr::from_ptr(table).to_str() {
+        Ok(s) => s,
+        Err(_) => return DBX_ERR_INVALID_UTF8,
+    };
+
+    let mut entries = Vec::with_capacity(count);
+    if count == 0 {
+        *out_result = Box::into_raw(Box::new(DbxScanResult { entries }));
+        return DBX_OK;
+    }
+
+    let key_offsets = slice::from_raw_parts(key_offsets, count + 1);
+    if key_offsets.windows(2).any(|w| w[0] > w[1]) {
+        return DBX_ERR_INVALID_OP;
+    }
+
+    let Some(keys) = packed_bytes(key_data, key_offsets[count] as usize) else {
+        return DBX_ERR_NULL_PTR;
+    };
+
+    for i in 0..count {
+        let k = &keys[key_offsets[i] as usize..key_offsets[i + 1] as usize];
+        match handle.db.get(table_str, k) {
+            Ok(Some(value)) => {
+                *out_found.add(i) = 1;
+                entries.push((Vec::new(), value));
+            }
+            Ok(None) => *out_found.add(i) = 0,
+            Err(_) => return DBX_ERR_DATABASE,
+        }
+    }
+
+    *out_result = Box::into_raw(Box::new(DbxScanResult { entries }));
+    DBX_OK
+}
+
 /// Scan all key-value pairs in a table.
 /// Returns an opaque DbxScanResult handle. Use accessor functions to read entries.
 #[unsafe(no_mangle)]
@@ -375,6 +605,150 @@ pub unsafe extern "C" fn dbx_scan_result_value(
     DBX_OK
 }
 
+/// Get both the key and the value of a scan result entry by index
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_scan_result_entry(
+    result: *const DbxScanResult,
+    index: usize,
+    out_key: *mut *const u8,
+    out_key_len: *mut usize,
+    out_value: *mut *const u8,
+    out_value_len: *mut usize,
+) -> c_int {
+    if result.is_null()
+        || out_key.is_null()
+        || out_key_len.is_null()
+        || out_value.is_null()
+        || out_value_len.is_null()
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let result = &*result;
+    let Some((key, value)) = result.entries.get(index) else {
+        return DBX_ERR_NOT_FOUND;
+    };
+
+    *out_key = key.as_ptr();
+    *out_key_len = key.len();
+    *out_value = value.as_ptr();
+    *out_value_len = value.len();
+    DBX_OK
+}
+
+/// Copy the pointers and lengths of up to `count` scan result entries
+/// starting at `start` into caller-provided arrays
+///
+/// The number of entries written is stored in `out_filled`. The pointers
+/// stay valid until the scan result is freed.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_scan_result_bulk(
+    result: *const DbxScanResult,
+    start: usize,
+    count: usize,
+    out_keys: *mut *const u8,
+    out_key_lens: *mut usize,
+    out_values: *mut *const u8,
+    out_value_lens: *mut usize,
+    out_filled: *mut usize,
+) -> c_int {
+    if result.is_null() || out_filled.is_null() {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let result = &*result;
+    let entries = result.entries.get(start..).unwrap_or(&[]);
+    let filled = entries.len().min(count);
+    if filled > 0
+        && (out_keys.is_null()
+            || out_key_lens.is_null()
+            || out_values.is_null()
+            || out_value_lens.is_null())
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    for (i, (key, value)) in entries[..filled].iter().enumerate() {
+        *out_keys.add(i) = key.as_ptr();
+        *out_key_lens.add(i) = key.len();
+        *out_values.add(i) = value.as_ptr();
+        *out_value_lens.add(i) = value.len();
+    }
+
+    *out_filled = filled;
+    DBX_OK
+}
+
+/// Copy up to `count` scan result entries starting at `start` into a
+/// caller-provided buffer: all of their keys back to back, then all of
+/// their values
+///
+/// Only whole entries that fit in `buf_cap` bytes are copied; their
+/// lengths are written to `out_key_lens`/`out_value_lens` and their number
+/// to `out_filled`. Returns `DBX_ERR_BUFFER_TOO_SMALL` (with the first
+/// entry's lengths written) if not even one entry fits.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_scan_result_pack(
+    result: *const DbxScanResult,
+    start: usize,
+    count: usize,
+    buf: *mut u8,
+    buf_cap: usize,
+    out_key_lens: *mut usize,
+    out_value_lens: *mut usize,
+    out_filled: *mut usize,
+) -> c_int {
+    if result.is_null() || out_filled.is_null() {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let result = &*result;
+    let entries = result.entries.get(start..).unwrap_or(&[]);
+    let entries = &entries[..entries.len().min(count)];
+    if !entries.is_empty() && (out_key_lens.is_null() || out_value_lens.is_null()) {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let mut total = 0;
+    let mut filled = 0;
+    for (key, value) in entries {
+        let size = key.len() + value.len();
+        if total + size > buf_cap {
+            break;
+        }
+        total += size;
+        filled += 1;
+    }
+
+    *out_filled = filled;
+    if filled == 0 {
+        if let Some((key, value)) = entries.first() {
+            *out_key_lens = key.len();
+            *out_value_lens = value.len();
+            return DBX_ERR_BUFFER_TOO_SMALL;
+        }
+        return DBX_OK;
+    }
+    let buf = match (buf.is_null(), total) {
+        (true, 0) => ptr::NonNull::dangling().as_ptr(),
+        (true, _) => return DBX_ERR_NULL_PTR,
+        (false, _) => buf,
+    };
+
+    let mut offset = 0;
+    for (i, (key, _)) in entries[..filled].iter().enumerate() {
+        ptr::copy_nonoverlapping(key.as_ptr(), buf.add(offset), key.len());
+        offset += key.len();
+        *out_key_lens.add(i) = key.len();
+    }
+    for (i, (_, value)) in entries[..filled].iter().enumerate() {
+        ptr::copy_nonoverlapping(value.as_ptr(), buf.add(offset), value.len());
+        offset += value.len();
+        *out_value_lens.add(i) = value.len();
+    }
+    DBX_OK
+}
+
 /// Free a scan result
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn dbx_scan_result_free(result: *mut DbxScanResult) {
@@ -481,6 +855,40 @@ pub unsafe extern "C" fn dbx_string_list_get(
     DBX_OK
 }
 
+/// Copy the pointers and lengths of up to `count` strings starting at
+/// `start` into caller-provided arrays
+///
+/// The number of strings written is stored in `out_filled`. The pointers
+/// stay valid until the string list is freed.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_string_list_bulk(
+    list: *const DbxStringList,
+    start: usize,
+    count: usize,
+    out_strs: *mut *const u8,
+    out_lens: *mut usize,
+    out_filled: *mut usize,
+) -> c_int {
+    if list.is_null() || out_filled.is_null() {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let list = &*list;
+    let names = list.names.get(start..).unwrap_or(&[]);
+    let filled = names.len().min(count);
+    if filled > 0 && (out_strs.is_null() || out_lens.is_null()) {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    for (i, name) in names[..filled].iter().enumerate() {
+        *out_strs.add(i) = name.as_ptr();
+        *out_lens.add(i) = name.len();
+    }
+
+    *out_filled = filled;
+    DBX_OK
+}
+
 /// Free a string list
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn dbx_string_list_free(list: *mut DbxStringList) {
@@ -866,6 +1274,86 @@ pub unsafe extern "C" fn dbx_transaction_delete(
     DBX_OK
 }
 
+/// Insert multiple key-value pairs within a transaction (buffered, batch)
+///
+/// `keys` and `values` are arrays of pointers, `key_lens` and `value_lens`
+/// are parallel arrays of lengths. `count` is the number of pairs.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_transaction_insert_batch(
+    tx: *mut DbxTransaction,
+    table: *const c_char,
+    keys: *const *const u8,
+    key_lens: *const usize,
+    values: *const *const u8,
+    value_lens: *const usize,
+    count: usize,
+) -> c_int {
+    if tx.is_null()
+        || table.is_null()
+        || keys.is_null()
+        || key_lens.is_null()
+        || values.is_null()
+        || value_lens.is_null()
+    {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let tx = &mut *tx;
+
+    let table_str = match CStr::from_ptr(table).to_str() {
+        Ok(s) => s,
+        Err(_) => return DBX_ERR_INVALID_UTF8,
+    };
+
+    tx.operations.reserve(count);
+    for i in 0..count {
+        let key = slice::from_raw_parts(*keys.add(i), *key_lens.add(i)).to_vec();
+        let value = slice::from_raw_parts(*values.add(i), *value_lens.add(i)).to_vec();
+        tx.operations.push(TxOperation::Insert {
+            table: table_str.to_string(),
+            key,
+            value,
+        });
+    }
+
+    DBX_OK
+}
+
+/// Delete multiple keys within a transaction (buffered, batch)
+///
+/// `keys` is an array of pointers and `key_lens` a parallel array of lengths.
+/// `count` is the number of keys.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn dbx_transaction_delete_batch(
+    tx: *mut DbxTransaction,
+    table: *const c_char,
+    keys: *const *const u8,
+    key_lens: *const usize,
+    count: usize,
+) -> c_int {
+    if tx.is_null() || table.is_null() || keys.is_null() || key_lens.is_null() {
+        return DBX_ERR_NULL_PTR;
+    }
+
+    let tx = &mut *tx;
+
+    let table_str = match CStr::from_ptr(table).to_str() {
+        Ok(s) => s,
+        Err(_) => return DBX_ERR_INVALID_UTF8,
+    };
+
+    tx.operations.reserve(count);
+    for i in 0..count {
+        let key = slice::from_raw_parts(*keys.add(i), *key_lens.add(i)).to_vec();
+        tx.operations.push(TxOperation::Delete {
+            table: table_str.to_string(),
+            key,
+        });
+    }
+
+    DBX_OK
+}
+
 /// Commit a transaction - apply all buffered operations atomically using batch insert
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn dbx_transaction_commit(tx: *mut DbxTransaction) -> c_int {
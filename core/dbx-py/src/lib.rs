@@ -5,12 +5,16 @@
 #![allow(clippy::useless_conversion)]
 
 use dbx_core::Database as CoreDatabase;
-use pyo3::exceptions::PyRuntimeError;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 
 /// Python Database class
-#[pyclass]
+///
+/// Frozen: every method takes `&self` (the core database synchronizes
+/// internally), so PyO3 can skip the runtime borrow-flag check it would
+/// otherwise perform on each call.
+#[pyclass(frozen)]
 struct Database {
     db: CoreDatabase,
 }
@@ -50,10 +54,12 @@ impl Database {
     // ═══════════════════════════════════════════════════════
 
     /// Insert a key-value pair into a table
-    fn insert(&self, table: &str, key: &[u8], value: &[u8]) -> PyResult<()> {
-        self.db
-            .insert(table, key, value)
-            .map_err(|e| PyRuntimeError::new_err(format!("Insert failed: {e}")))
+    fn insert(&self, py: Python<'_>, table: &str, key: &[u8], value: &[u8]) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.db
+                .insert(table, key, value)
+                .map_err(|e| PyRuntimeError::new_err(format!("Insert failed: {e}")))
+        })
     }
 
     /// Get a value by key from a table
@@ -63,19 +69,22 @@ impl Database {
         table: &str,
         key: &[u8],
     ) -> PyResult<Option<Bound<'py, PyBytes>>> {
-        match self.db.get(table, key) {
-            Ok(Some(value)) => Ok(Some(PyBytes::new_bound(py, &value))),
-            Ok(None) => Ok(None),
-            Err(e) => Err(PyRuntimeError::new_err(format!("Get failed: {e}"))),
-        }
+        let value = py.allow_threads(|| {
+            self.db
+                .get(table, key)
+                .map_err(|e| PyRuntimeError::new_err(format!("Get failed: {e}")))
+        })?;
+        Ok(value.map(|v| PyBytes::new_bound(py, &v)))
     }
 
     /// Delete a key from a table
-    fn delete(&self, table: &str, key: &[u8]) -> PyResult<()> {
-        self.db
-            .delete(table, key)
-            .map(|_| ())
-            .map_err(|e| PyRuntimeError::new_err(format!("Delete failed: {e}")))
+    fn delete(&self, py: Python<'_>, table: &str, key: &[u8]) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.db
+                .delete(table, key)
+                .map(|_| ())
+                .map_err(|e| PyRuntimeError::new_err(format!("Delete failed: {e}")))
+        })
     }
 
     // ═══════════════════════════════════════════════════════
@@ -83,10 +92,68 @@ impl Database {
     // ═══════════════════════════════════════════════════════
 
     /// Insert multiple key-value pairs at once
-    fn insert_batch(&self, table: &str, rows: Vec<(Vec<u8>, Vec<u8>)>) -> PyResult<()> {
-        self.db
-            .insert_batch(table, rows)
-            .map_err(|e| PyRuntimeError::new_err(format!("Batch insert failed: {e}")))
+    fn insert_batch(
+        &self,
+        py: Python<'_>,
+        table: &str,
+        rows: Vec<(Vec<u8>, Vec<u8>)>,
+    ) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.db
+                .insert_batch(table, rows)
+                .map_err(|e| PyRuntimeError::new_err(format!("Batch insert failed: {e}")))
+        })
+    }
+
+    /// Insert parallel lists of keys and values at once
+    fn insert_many(
+        &self,
+        py: Python<'_>,
+        table: &str,
+        keys: Vec<Bound<'_, PyBytes>>,
+        values: Vec<Bound<'_, PyBytes>>,
+    ) -> PyResult<()> {
+        if keys.len() != values.len() {
+            return Err(PyValueError::new_err(
+                "keys and values must have the same length",
+            ));
+        }
+        // Copy straight out of the bytes objects while the GIL is held
+        let rows = keys
+            .iter()
+            .zip(&values)
+            .map(|(key, value)| (key.as_bytes().to_vec(), value.as_bytes().to_vec()))
+            .collect();
+        py.allow_threads(|| {
+            self.db
+                .insert_batch(table, rows)
+                .map_err(|e| PyRuntimeError::new_err(format!("Batch insert failed: {e}")))
+        })
+    }
+
+    /// Get many values at once; missing keys map to None
+    fn get_many<'py>(
+        &self,
+        py: Python<'py>,
+        table: &str,
+        keys: Vec<Bound<'py, PyBytes>>,
+    ) -> PyResult<Vec<Option<Bound<'py, PyBytes>>>> {
+        // Borrow the key bytes; the bytes objects in `keys` outlive the call
+        let key_bytes: Vec<&[u8]> = keys.iter().map(|key| key.as_bytes()).collect();
+        let values = py.allow_threads(|| {
+            key_bytes
+                .iter()
+                .map(|key| {
+                    self.db
+                        .get(table, key)
+                        .map_err(|e| PyRuntimeError::new_err(format!("Get failed: {e}")))
+                })
+                .collect::<PyResult<Vec<_>>>()
+        })?;
+        Ok(values
+            .into_iter()
+            .map(|value| value.map(|v| PyBytes::new_bound(py, &v)))
+            .collect())
     }
 
     /// Scan all key-value pairs in a table
@@ -95,10 +162,11 @@ impl Database {
         py: Python<'py>,
         table: &str,
     ) -> PyResult<Vec<(Bound<'py, PyBytes>, Bound<'py, PyBytes>)>> {
-        let entries = self
-            .db
-            .scan(table)
-            .map_err(|e| PyRuntimeError::new_err(format!("Scan failed: {e}")))?;
+        let entries = py.allow_threads(|| {
+            self.db
+                .scan(table)
+                .map_err(|e| PyRuntimeError::new_err(format!("Scan failed: {e}")))
+        })?;
         Ok(entries
             .into_iter()
             .map(|(k, v)| (PyBytes::new_bound(py, &k), PyBytes::new_bound(py, &v)))
@@ -113,10 +181,11 @@ impl Database {
         start_key: &[u8],
         end_key: &[u8],
     ) -> PyResult<Vec<(Bound<'py, PyBytes>, Bound<'py, PyBytes>)>> {
-        let entries = self
-            .db
-            .range(table, start_key, end_key)
-            .map_err(|e| PyRuntimeError::new_err(format!("Range scan failed: {e}")))?;
+        let entries = py.allow_threads(|| {
+            self.db
+                .range(table, start_key, end_key)
+                .map_err(|e| PyRuntimeError::new_err(format!("Range scan failed: {e}")))
+        })?;
         Ok(entries
             .into_iter()
             .map(|(k, v)| (PyBytes::new_bound(py, &k), PyBytes::new_bound(py, &v)))
@@ -128,17 +197,21 @@ impl Database {
     // ═══════════════════════════════════════════════════════
 
     /// Count the number of rows in a table
-    fn count(&self, table: &str) -> PyResult<usize> {
-        self.db
-            .count(table)
-            .map_err(|e| PyRuntimeError::new_err(format!("Count failed: {e}")))
+    fn count(&self, py: Python<'_>, table: &str) -> PyResult<usize> {
+        py.allow_threads(|| {
+            self.db
+                .count(table)
+                .map_err(|e| PyRuntimeError::new_err(format!("Count failed: {e}")))
+        })
     }
 
     /// Flush the database to disk
-    fn flush(&self) -> PyResult<()> {
-        self.db
-            .flush()
-            .map_err(|e| PyRuntimeError::new_err(format!("Flush failed: {e}")))
+    fn flush(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.db
+                .flush()
+                .map_err(|e| PyRuntimeError::new_err(format!("Flush failed: {e}")))
+        })
     }
 
     /// Get all table names
@@ -165,11 +238,13 @@ impl Database {
     // ═══════════════════════════════════════════════════════
 
     /// Execute a SQL statement (SELECT/INSERT/UPDATE/DELETE)
-    fn execute_sql(&self, sql: &str) -> PyResult<usize> {
-        self.db
-            .execute_sql(sql)
-            .map(|batches| batches.iter().map(|b| b.num_rows()).sum::<usize>())
-            .map_err(|e| PyRuntimeError::new_err(format!("SQL execution failed: {e}")))
+    fn execute_sql(&self, py: Python<'_>, sql: &str) -> PyResult<usize> {
+        py.allow_threads(|| {
+            self.db
+                .execute_sql(sql)
+                .map(|batches| batches.iter().map(|b| b.num_rows()).sum::<usize>())
+                .map_err(|e| PyRuntimeError::new_err(format!("SQL execution failed: {e}")))
+        })
     }
 
     // ═══════════════════════════════════════════════════════
@@ -200,10 +275,12 @@ impl Database {
     // ═══════════════════════════════════════════════════════
 
     /// Save the in-memory database to a file
-    fn save_to_file(&self, path: &str) -> PyResult<()> {
-        self.db
-            .save_to_file(path)
-            .map_err(|e| PyRuntimeError::new_err(format!("Save failed: {e}")))
+    fn save_to_file(&self, py: Python<'_>, path: &str) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.db
+                .save_to_file(path)
+                .map_err(|e| PyRuntimeError::new_err(format!("Save failed: {e}")))
+        })
     }
 
     // ═══════════════════════════════════════════════════════
@@ -223,14 +300,17 @@ impl Database {
     /// Insert a versioned key-value pair (MVCC)
     fn insert_versioned(
         &self,
+        py: Python<'_>,
         table: &str,
         key: &[u8],
         value: &[u8],
         commit_ts: u64,
     ) -> PyResult<()> {
-        self.db
-            .insert_versioned(table, key, Some(value), commit_ts)
-            .map_err(|e| PyRuntimeError::new_err(format!("Versioned insert failed: {e}")))
+        py.allow_threads(|| {
+            self.db
+                .insert_versioned(table, key, Some(value), commit_ts)
+                .map_err(|e| PyRuntimeError::new_err(format!("Versioned insert failed: {e}")))
+        })
     }
 
     /// Read a specific version of a key (Snapshot Read)
@@ -241,13 +321,12 @@ impl Database {
         key: &[u8],
         read_ts: u64,
     ) -> PyResult<Option<Bound<'py, PyBytes>>> {
-        match self.db.get_snapshot(table, key, read_ts) {
-            Ok(Some(Some(value))) => Ok(Some(PyBytes::new_bound(py, &value))),
-            Ok(Some(None)) | Ok(None) => Ok(None),
-            Err(e) => Err(PyRuntimeError::new_err(format!(
-                "Snapshot read failed: {e}"
-            ))),
-        }
+        let value = py.allow_threads(|| {
+            self.db
+                .get_snapshot(table, key, read_ts)
+                .map_err(|e| PyRuntimeError::new_err(format!("Snapshot read failed: {e}")))
+        })?;
+        Ok(value.flatten().map(|v| PyBytes::new_bound(py, &v)))
     }
 
     // ═══════════════════════════════════════════════════════
@@ -326,19 +405,20 @@ impl Transaction {
             }
         }
 
-        for (table, rows) in insert_batches {
-            db.db
-                .insert_batch(&table, rows)
-                .map_err(|e| PyRuntimeError::new_err(format!("Batch insert failed: {e}")))?;
-        }
+        let core = &db.db;
+        py.allow_threads(|| {
+            for (table, rows) in insert_batches {
+                core.insert_batch(&table, rows)
+                    .map_err(|e| PyRuntimeError::new_err(format!("Batch insert failed: {e}")))?;
+            }
 
-        for (table, key) in delete_ops {
-            db.db
-                .delete(&table, &key)
-                .map_err(|e| PyRuntimeError::new_err(format!("Delete failed: {e}")))?;
-        }
+            for (table, key) in delete_ops {
+                core.delete(&table, &key)
+                    .map_err(|e| PyRuntimeError::new_err(format!("Delete failed: {e}")))?;
+            }
 
-        Ok(())
+            Ok(())
+        })
     }
 
     /// Rollback the transaction
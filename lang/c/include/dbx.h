@@ -27,6 +27,7 @@ typedef struct DbxStringList DbxStringList;
 #define DBX_ERR_DATABASE -3
 #define DBX_ERR_NOT_FOUND -4
 #define DBX_ERR_INVALID_OP -5
+#define DBX_ERR_BUFFER_TOO_SMALL -6
 
 /* ========================================
  * Constructors
@@ -58,6 +59,16 @@ int dbx_get(
     size_t* out_len
 );
 
+int dbx_get_into(
+    DbxHandle* handle,
+    const char* table,
+    const uint8_t* key,
+    size_t key_len,
+    uint8_t* buf,
+    size_t buf_cap,
+    size_t* out_len
+);
+
 int dbx_delete(
     DbxHandle* handle,
     const char* table,
@@ -79,6 +90,35 @@ int dbx_insert_batch(
     size_t count
 );
 
+int dbx_insert_many(
+    DbxHandle* handle,
+    const char* table,
+    size_t count,
+    const uint64_t* key_offsets,
+    const uint8_t* key_data,
+    const uint64_t* value_offsets,
+    const uint8_t* value_data
+);
+
+int dbx_get_many(
+    DbxHandle* handle,
+    const char* table,
+    size_t count,
+    const uint64_t* key_offsets,
+    const uint8_t* key_data,
+    uint8_t* out_found,
+    DbxScanResult** out_result
+);
+
+int dbx_get_many_discard(
+    DbxHandle* handle,
+    const char* table,
+    const uint8_t** keys,
+    const size_t* key_lens,
+    size_t count,
+    size_t* out_hits
+);
+
 int dbx_scan(
     DbxHandle* handle,
     const char* table,
@@ -101,6 +141,17 @@ int dbx_scan_result_key(const DbxScanResult* result, size_t index,
                         const uint8_t** out_key, size_t* out_key_len);
 int dbx_scan_result_value(const DbxScanResult* result, size_t index,
                           const uint8_t** out_value, size_t* out_value_len);
+int dbx_scan_result_entry(const DbxScanResult* result, size_t index,
+                          const uint8_t** out_key, size_t* out_key_len,
+                          const uint8_t** out_value, size_t* out_value_len);
+int dbx_scan_result_bulk(const DbxScanResult* result, size_t start, size_t count,
+                         const uint8_t** out_keys, size_t* out_key_lens,
+                         const uint8_t** out_values, size_t* out_value_lens,
+                         size_t* out_filled);
+int dbx_scan_result_pack(const DbxScanResult* result, size_t start, size_t count,
+                         uint8_t* buf, size_t buf_cap,
+                         size_t* out_key_lens, size_t* out_value_lens,
+                         size_t* out_filled);
 void dbx_scan_result_free(DbxScanResult* result);
 
 /* ========================================
@@ -117,6 +168,9 @@ int dbx_is_encrypted(DbxHandle* handle);
 size_t dbx_string_list_count(const DbxStringList* list);
 int dbx_string_list_get(const DbxStringList* list, size_t index,
                         const uint8_t** out_str, size_t* out_len);
+int dbx_string_list_bulk(const DbxStringList* list, size_t start, size_t count,
+                         const uint8_t** out_strs, size_t* out_lens,
+                         size_t* out_filled);
 void dbx_string_list_free(DbxStringList* list);
 
 /* ========================================
@@ -200,6 +254,24 @@ int dbx_transaction_delete(
     size_t key_len
 );
 
+int dbx_transaction_insert_batch(
+    DbxTransaction* tx,
+    const char* table,
+    const uint8_t** keys,
+    const size_t* key_lens,
+    const uint8_t** values,
+    const size_t* value_lens,
+    size_t count
+);
+
+int dbx_transaction_delete_batch(
+    DbxTransaction* tx,
+    const char* table,
+    const uint8_t** keys,
+    const size_t* key_lens,
+    size_t count
+);
+
 int dbx_transaction_commit(DbxTransaction* tx);
 void dbx_transaction_rollback(DbxTransaction* tx);
 
@@ -0,0 +1,120 @@
+"""
+Helpers shared by the DBX benchmark scripts
+"""
+
+import ctypes
+import functools
+import gc
+import itertools
+import mmap
+import time
+import timeit
+
+
+# Keys per SELECT ... IN (...) round-trip in the SQLite GET phase
+GET_CHUNK_SIZE = 500
+
+# Alignment guaranteed for packed key/value blobs
+CACHELINE = 64
+
+# SQL text shared by every SQLite phase so the statement cache keeps hitting
+CREATE_SQL = "CREATE TABLE IF NOT EXISTS bench (key TEXT PRIMARY KEY, value TEXT)"
+INSERT_SQL = "INSERT INTO bench (key, value) VALUES (?, ?)"
+DELETE_SQL = "DELETE FROM bench WHERE key = ?"
+
+
+@functools.lru_cache(maxsize=None)
+def select_in_sql(count):
+    """SELECT ... IN (...) statement text for a chunk of count keys"""
+    return f"SELECT value FROM bench WHERE key IN ({','.join('?' * count)})"
+
+
+def time_once(fn):
+    """Time a single call of fn with the garbage collector paused"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def time_repeatable(fn):
+    """Time an idempotent fn after one warmup call; returns seconds per call"""
+    fn()
+    gc.collect()
+    iterations, elapsed = timeit.Timer(fn).autorange()
+    return elapsed / iterations
+
+
+def tune_sqlite(conn, in_memory=True):
+    """Apply pragmas that strip durability overhead from the SQLite baseline"""
+    journal_mode = "MEMORY" if in_memory else "WAL"
+    for pragma in (
+        f"journal_mode={journal_mode}",
+        "synchronous=OFF",
+        "temp_store=MEMORY",
+        "locking_mode=EXCLUSIVE",
+        "cache_size=-65536",
+    ):
+        conn.execute(f"PRAGMA {pragma}")
+
+
+class ArrayPool:
+    """Free lists of ctypes arrays keyed by item type and length
+
+    Arrays handed back with release() are reused by later acquire() calls
+    instead of being reallocated, e.g. across the runs of the batch sweep.
+    """
+
+    def __init__(self):
+        self._free = {}
+
+    def acquire(self, ctype, n):
+        free = self._free.get((ctype, n))
+        return free.pop() if free else (ctype * n)()
+
+    def release(self, array):
+        self._free.setdefault((array._type_, len(array)), []).append(array)
+
+
+ARRAY_POOL = ArrayPool()
+
+
+def pack_keyspace(items, pool=ARRAY_POOL):
+    """Pack byte strings into one contiguous blob plus pointer/length arrays
+
+    The blob lives in an anonymous mmap, so its base is page-aligned (and
+    therefore cacheline-aligned) for the engine's copy/compare loops. The
+    pointers address slices of it, so it must stay alive for as long as
+    the arrays are in use. The arrays come from pool and may be released
+    back to it once the caller is done with them.
+    """
+    n = len(items)
+    data = b"".join(items)
+    blob = mmap.mmap(-1, max(len(data), 1))
+    blob[:len(data)] = data
+    lens = pool.acquire(ctypes.c_size_t, n)
+    lens[:] = list(map(len, items))
+    base = ctypes.addressof(ctypes.c_char.from_buffer(blob))
+    assert base % CACHELINE == 0
+    offsets = itertools.accumulate(lens, initial=base)
+    ptrs = pool.acquire(ctypes.c_char_p, n)
+    ptrs[:] = list(itertools.islice(offsets, n))
+    return blob, ptrs, lens
+
+
+def split_batches(array, batch_size):
+    """Split a ctypes array into zero-copy views of at most batch_size items
+
+    Each view keeps the source array alive, but not whatever its elements
+    point into.
+    """
+    n = len(array)
+    item_size = ctypes.sizeof(array._type_)
+    return [
+        (array._type_ * min(batch_size, n - i)).from_buffer(array, i * item_size)
+        for i in range(0, n, batch_size)
+    ]
@@ -4,60 +4,133 @@ DBX Python Bindings - Performance Benchmark
 Measures the performance of basic CRUD operations.
 """
 
+import array
+import statistics
 import time
 import sys
 import os
+from dataclasses import dataclass
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from dbx_py import Database
+from bench_utils import time_once, time_repeatable
 
 
-def benchmark_insert(db, n=10000):
-    """Benchmark insert operations"""
-    start = time.perf_counter()
-    
-    for i in range(n):
-        key = f"key:{i}".encode()
-        value = f"value:{i}".encode()
-        db.insert("bench", key, value)
+@dataclass
+class PhaseResult:
+    """Timing of one benchmark phase, formatted only after all phases ran"""
+    name: str
+    elapsed: float
+    n: int
+    latencies_ns: Optional[List[int]] = None
+
+    @property
+    def ops_per_sec(self):
+        return self.n / self.elapsed
+
+    @property
+    def ms_per_op(self):
+        return self.elapsed / self.n * 1000
+
+
+def print_report(results):
+    """Print benchmark results"""
+    for result in results:
+        print(f"\n{result.name}:")
+        print(f"  Time: {result.elapsed:.4f}s")
+        print(f"  Throughput: {result.ops_per_sec:,.0f} ops/sec")
+        print(f"  Latency: {result.ms_per_op:.4f} ms/op")
+        if result.latencies_ns:
+            cuts = statistics.quantiles(result.latencies_ns, n=100)
+            print(f"  p50/p95/p99: {cuts[49]:,.0f} / {cuts[94]:,.0f} / {cuts[98]:,.0f} ns")
+
+
+def benchmark_insert(db, n=10000, slow=False):
+    """Benchmark insert operations (one insert_many call, or per-row if slow)"""
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    values = list(map(b"value:%d".__mod__, range(n)))
     
-    end = time.perf_counter()
-    elapsed = end - start
-    ops_per_sec = n / elapsed
+    if slow:
+        insert = db.insert
+        
+        def run():
+            for key, value in zip(keys, values):
+                insert("bench", key, value)
+    else:
+        def run():
+            db.insert_many("bench", keys, values)
     
-    return elapsed, ops_per_sec
+    return time_once(run)
 
 
 def benchmark_get(db, n=10000):
     """Benchmark get operations"""
-    start = time.perf_counter()
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    
+    get = db.get
+    
+    def run():
+        for key in keys:
+            _ = get("bench", key)
+    
+    return time_repeatable(run)
+
+
+def benchmark_get_latency(db, n=10000):
+    """Sample per-operation get latency in nanoseconds"""
+    keys = list(map(b"key:%d".__mod__, range(n)))
     
-    for i in range(n):
-        key = f"key:{i}".encode()
-        _ = db.get("bench", key)
+    get = db.get
+    pc = time.perf_counter_ns
+    samples = array.array("q", [0]) * (n + 1)
     
-    end = time.perf_counter()
-    elapsed = end - start
-    ops_per_sec = n / elapsed
+    def run():
+        samples[0] = pc()
+        for i, key in enumerate(keys, 1):
+            _ = get("bench", key)
+            samples[i] = pc()
     
-    return elapsed, ops_per_sec
+    time_once(run)
+    return [end - start for start, end in zip(samples, samples[1:])]
+
+
+def benchmark_get_parallel(db, n=10000, threads=4):
+    """Benchmark get operations split across a thread pool
+
+    ctypes releases the GIL for the duration of each FFI call, so the reads
+    themselves can overlap inside the engine.
+    """
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    chunks = [keys[i::threads] for i in range(threads)]
+    
+    get = db.get
+    
+    def get_chunk(chunk):
+        for key in chunk:
+            _ = get("bench", key)
+    
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        def run():
+            list(pool.map(get_chunk, chunks))
+        
+        return time_repeatable(run)
 
 
 def benchmark_delete(db, n=10000):
     """Benchmark delete operations"""
-    start = time.perf_counter()
+    keys = list(map(b"key:%d".__mod__, range(n)))
     
-    for i in range(n):
-        key = f"key:{i}".encode()
-        db.delete("bench", key)
+    delete = db.delete
     
-    end = time.perf_counter()
-    elapsed = end - start
-    ops_per_sec = n / elapsed
+    def run():
+        for key in keys:
+            delete("bench", key)
     
-    return elapsed, ops_per_sec
+    return time_once(run)
 
 
 def main():
@@ -70,28 +143,24 @@ def main():
     
     try:
         n = 10000
-        print(f"\nRunning benchmarks with {n:,} operations...\n")
-        
-        # Benchmark INSERT
-        print("Benchmarking INSERT...")
-        elapsed, ops_per_sec = benchmark_insert(db, n)
-        print(f"  Time: {elapsed:.4f}s")
-        print(f"  Throughput: {ops_per_sec:,.0f} ops/sec")
-        print(f"  Latency: {(elapsed/n)*1000:.4f} ms/op")
-        
-        # Benchmark GET
-        print("\nBenchmarking GET...")
-        elapsed, ops_per_sec = benchmark_get(db, n)
-        print(f"  Time: {elapsed:.4f}s")
-        print(f"  Throughput: {ops_per_sec:,.0f} ops/sec")
-        print(f"  Latency: {(elapsed/n)*1000:.4f} ms/op")
+        threads = os.cpu_count() or 1
+        # --slow times per-row db.insert instead of one insert_many call
+        slow = "--slow" in sys.argv[1:]
+        print(f"\nRunning benchmarks with {n:,} operations...")
         
-        # Benchmark DELETE
-        print("\nBenchmarking DELETE...")
-        elapsed, ops_per_sec = benchmark_delete(db, n)
-        print(f"  Time: {elapsed:.4f}s")
-        print(f"  Throughput: {ops_per_sec:,.0f} ops/sec")
-        print(f"  Latency: {(elapsed/n)*1000:.4f} ms/op")
+        # Time every phase first; formatting waits until all are done
+        results = []
+        results.append(PhaseResult(
+            "INSERT (per-row)" if slow else "INSERT", benchmark_insert(db, n, slow), n
+        ))
+        results.append(PhaseResult("GET", benchmark_get(db, n), n))
+        latencies = benchmark_get_latency(db, n)
+        results.append(PhaseResult("GET (sampled)", sum(latencies) / 1e9, n, latencies))
+        results.append(PhaseResult(
+            f"GET ({threads} threads)", benchmark_get_parallel(db, n, threads), n
+        ))
+        results.append(PhaseResult("DELETE", benchmark_delete(db, n), n))
+        print_report(results)
         
         print("\n" + "=" * 60)
         print("Benchmark completed!")
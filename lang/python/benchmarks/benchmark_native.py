@@ -4,11 +4,15 @@ DBX Native (PyO3) vs SQLite - Performance Comparison
 Tests the PyO3 native bindings performance.
 """
 
-import time
 import sys
 import os
 import sqlite3
 
+from bench_utils import (
+    CREATE_SQL, DELETE_SQL, GET_CHUNK_SIZE, INSERT_SQL, select_in_sql,
+    time_once, time_repeatable, tune_sqlite,
+)
+
 # Test native import
 try:
     import dbx_native
@@ -22,33 +26,35 @@ except ImportError as e:
 
 def benchmark_dbx_native(n=10000):
     """Benchmark DBX native PyO3 bindings"""
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    values = list(map(b"value:%d".__mod__, range(n)))
+    
     db = dbx_native.Database.open_in_memory()
     
     # INSERT with transaction
-    start = time.perf_counter()
-    tx = db.begin_transaction()
-    for i in range(n):
-        key = f"key:{i}".encode()
-        value = f"value:{i}".encode()
-        tx.insert("bench", key, value)
-    tx.commit()
-    insert_time = time.perf_counter() - start
+    def run_insert():
+        tx = db.begin_transaction()
+        insert = tx.insert
+        for key, value in zip(keys, values):
+            insert("bench", key, value)
+        tx.commit()
+    insert_time = time_once(run_insert)
     
     # GET
-    start = time.perf_counter()
-    for i in range(n):
-        key = f"key:{i}".encode()
-        _ = db.get("bench", key)
-    get_time = time.perf_counter() - start
+    get = db.get
+    def run_get():
+        for key in keys:
+            _ = get("bench", key)
+    get_time = time_repeatable(run_get)
     
     # DELETE with transaction
-    start = time.perf_counter()
-    tx = db.begin_transaction()
-    for i in range(n):
-        key = f"key:{i}".encode()
-        tx.delete("bench", key)
-    tx.commit()
-    delete_time = time.perf_counter() - start
+    def run_delete():
+        tx = db.begin_transaction()
+        delete = tx.delete
+        for key in keys:
+            delete("bench", key)
+        tx.commit()
+    delete_time = time_once(run_delete)
     
     db.close()
     return insert_time, get_time, delete_time
@@ -56,38 +62,40 @@ def benchmark_dbx_native(n=10000):
 
 def benchmark_sqlite(n=10000):
     """Benchmark SQLite operations"""
-    conn = sqlite3.connect(":memory:")
+    keys = list(map("key:%d".__mod__, range(n)))
+    values = list(map("value:%d".__mod__, range(n)))
+    
+    conn = sqlite3.connect(":memory:", cached_statements=256)
+    
+    tune_sqlite(conn)
     cursor = conn.cursor()
     
     try:
-        cursor.execute("CREATE TABLE IF NOT EXISTS bench (key TEXT PRIMARY KEY, value TEXT)")
+        cursor.execute(CREATE_SQL)
+        execute = cursor.execute
+        fetchall = cursor.fetchall
         
         # INSERT
-        start = time.perf_counter()
-        conn.execute("BEGIN TRANSACTION")
-        for i in range(n):
-            key = f"key:{i}"
-            value = f"value:{i}"
-            cursor.execute("INSERT INTO bench (key, value) VALUES (?, ?)", (key, value))
-        conn.commit()
-        insert_time = time.perf_counter() - start
+        def run_insert():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(INSERT_SQL, zip(keys, values))
+            conn.commit()
+        insert_time = time_once(run_insert)
         
         # GET
-        start = time.perf_counter()
-        for i in range(n):
-            key = f"key:{i}"
-            cursor.execute("SELECT value FROM bench WHERE key = ?", (key,))
-            _ = cursor.fetchone()
-        get_time = time.perf_counter() - start
+        def run_get():
+            for i in range(0, n, GET_CHUNK_SIZE):
+                chunk = keys[i:i + GET_CHUNK_SIZE]
+                execute(select_in_sql(len(chunk)), chunk)
+                _ = fetchall()
+        get_time = time_repeatable(run_get)
         
         # DELETE
-        start = time.perf_counter()
-        conn.execute("BEGIN TRANSACTION")
-        for i in range(n):
-            key = f"key:{i}"
-            cursor.execute("DELETE FROM bench WHERE key = ?", (key,))
-        conn.commit()
-        delete_time = time.perf_counter() - start
+        def run_delete():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(DELETE_SQL, zip(keys))
+            conn.commit()
+        delete_time = time_once(run_delete)
         
         return insert_time, get_time, delete_time
     finally:
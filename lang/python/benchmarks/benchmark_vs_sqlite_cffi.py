@@ -0,0 +1,198 @@
+"""
+DBX (CFFI) vs SQLite - Performance Comparison
+
+Drives the DBX C ABI through CFFI in ABI mode instead of ctypes, so each
+per-row FFI call skips ctypes' Python-level argument converters.
+"""
+
+import sys
+import os
+import sqlite3
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from dbx_py import Database
+from bench_utils import (
+    CREATE_SQL, DELETE_SQL, GET_CHUNK_SIZE, INSERT_SQL, select_in_sql,
+    time_once, time_repeatable, tune_sqlite,
+)
+
+# Test CFFI import
+try:
+    import cffi
+    print("✓ cffi imported successfully")
+except ImportError as e:
+    print(f"✗ cffi import failed: {e}")
+    sys.exit(1)
+
+
+# Subset of lang/c/include/dbx.h used by this benchmark. Key/value buffers
+# are declared as const char* so bytes objects are passed without a copy.
+CDEF = """
+typedef struct DbxHandle DbxHandle;
+typedef struct DbxTransaction DbxTransaction;
+
+int dbx_get(DbxHandle* handle, const char* table,
+            const char* key, size_t key_len,
+            uint8_t** out_value, size_t* out_len);
+void dbx_free_value(uint8_t* value, size_t len);
+
+DbxTransaction* dbx_begin_transaction(DbxHandle* handle);
+int dbx_transaction_insert(DbxTransaction* tx, const char* table,
+                           const char* key, size_t key_len,
+                           const char* value, size_t value_len);
+int dbx_transaction_delete(DbxTransaction* tx, const char* table,
+                           const char* key, size_t key_len);
+int dbx_transaction_commit(DbxTransaction* tx);
+"""
+
+
+def benchmark_dbx_cffi(n=10000):
+    """Benchmark DBX operations through CFFI with per-row FFI calls"""
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    values = list(map(b"value:%d".__mod__, range(n)))
+    
+    # Let the ctypes binding locate the library and own the handle
+    db = Database.open_in_memory()
+    
+    try:
+        ffi = cffi.FFI()
+        ffi.cdef(CDEF)
+        lib = ffi.dlopen(db._lib._name)
+        handle = ffi.cast("DbxHandle *", db._handle)
+        
+        begin = lib.dbx_begin_transaction
+        commit = lib.dbx_transaction_commit
+        get = lib.dbx_get
+        free_value = lib.dbx_free_value
+        unpack = ffi.unpack
+        
+        # INSERT with transaction
+        def run_insert():
+            tx = begin(handle)
+            insert = lib.dbx_transaction_insert
+            for key, value in zip(keys, values):
+                insert(tx, b"bench", key, len(key), value, len(value))
+            commit(tx)
+        insert_time = time_once(run_insert)
+        
+        # GET (no transaction needed)
+        out_value = ffi.new("uint8_t **")
+        out_len = ffi.new("size_t *")
+        def run_get():
+            for key in keys:
+                if get(handle, b"bench", key, len(key), out_value, out_len) == 0:
+                    _ = unpack(out_value[0], out_len[0])
+                    free_value(out_value[0], out_len[0])
+        get_time = time_repeatable(run_get)
+        
+        # DELETE with transaction
+        def run_delete():
+            tx = begin(handle)
+            delete = lib.dbx_transaction_delete
+            for key in keys:
+                delete(tx, b"bench", key, len(key))
+            commit(tx)
+        delete_time = time_once(run_delete)
+        
+        return insert_time, get_time, delete_time
+    finally:
+        db.close()
+
+
+def benchmark_sqlite(n=10000):
+    """Benchmark SQLite operations"""
+    keys = list(map("key:%d".__mod__, range(n)))
+    values = list(map("value:%d".__mod__, range(n)))
+    
+    conn = sqlite3.connect(":memory:", cached_statements=256)
+    
+    tune_sqlite(conn)
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute(CREATE_SQL)
+        execute = cursor.execute
+        fetchall = cursor.fetchall
+        
+        # INSERT
+        def run_insert():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(INSERT_SQL, zip(keys, values))
+            conn.commit()
+        insert_time = time_once(run_insert)
+        
+        # GET
+        def run_get():
+            for i in range(0, n, GET_CHUNK_SIZE):
+                chunk = keys[i:i + GET_CHUNK_SIZE]
+                execute(select_in_sql(len(chunk)), chunk)
+                _ = fetchall()
+        get_time = time_repeatable(run_get)
+        
+        # DELETE
+        def run_delete():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(DELETE_SQL, zip(keys))
+            conn.commit()
+        delete_time = time_once(run_delete)
+        
+        return insert_time, get_time, delete_time
+    finally:
+        conn.close()
+
+
+def print_results(name, insert_time, get_time, delete_time, n):
+    """Print benchmark results"""
+    print(f"\n{name}:")
+    print(f"  INSERT: {insert_time:.4f}s ({n/insert_time:,.0f} ops/sec)")
+    print(f"  GET:    {get_time:.4f}s ({n/get_time:,.0f} ops/sec)")
+    print(f"  DELETE: {delete_time:.4f}s ({n/delete_time:,.0f} ops/sec)")
+
+
+def main():
+    print("=" * 60)
+    print("DBX (CFFI) vs SQLite - Performance Comparison")
+    print("=" * 60)
+    
+    n = 10000
+    print(f"\nRunning benchmarks with {n:,} operations...\n")
+    
+    # Benchmark DBX (CFFI)
+    print("Benchmarking DBX (CFFI)...")
+    dbx_insert, dbx_get, dbx_delete = benchmark_dbx_cffi(n)
+    print_results("DBX (In-Memory, CFFI)", dbx_insert, dbx_get, dbx_delete, n)
+    
+    # Benchmark SQLite
+    print("\nBenchmarking SQLite (In-Memory)...")
+    sql_insert, sql_get, sql_delete = benchmark_sqlite(n)
+    print_results("SQLite (In-Memory)", sql_insert, sql_get, sql_delete, n)
+    
+    # Comparison
+    print("\n" + "=" * 60)
+    print("Performance Comparison:")
+    print("=" * 60)
+    
+    if dbx_insert < sql_insert:
+        print(f"INSERT: DBX is {sql_insert/dbx_insert:.2f}x faster")
+    else:
+        print(f"INSERT: SQLite is {dbx_insert/sql_insert:.2f}x faster")
+    
+    if dbx_get < sql_get:
+        print(f"GET:    DBX is {sql_get/dbx_get:.2f}x faster")
+    else:
+        print(f"GET:    SQLite is {dbx_get/sql_get:.2f}x faster")
+    
+    if dbx_delete < sql_delete:
+        print(f"DELETE: DBX is {sql_delete/dbx_delete:.2f}x faster")
+    else:
+        print(f"DELETE: SQLite is {dbx_delete/sql_delete:.2f}x faster")
+    
+    print("\n" + "=" * 60)
+    print("Benchmark completed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ DBX vs SQLite - Performance Comparison Benchmark (with FFI Transaction)
 Compares DBX Python bindings with SQLite using native FFI transactions.
 """
 
-import time
 import sys
 import os
 import sqlite3
@@ -14,91 +13,122 @@ import ctypes
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from dbx_py import Database
+from bench_utils import (
+    ARRAY_POOL, CREATE_SQL, DELETE_SQL, GET_CHUNK_SIZE, INSERT_SQL,
+    pack_keyspace, select_in_sql, split_batches, time_once,
+    time_repeatable, tune_sqlite,
+)
 
 
-def benchmark_dbx_with_ffi_transaction(n=10000):
-    """Benchmark DBX operations with FFI transaction"""
+# Rows per FFI transaction commit; the sweep in main() runs each size
+BATCH_SIZES = (100, 500, 2000, 10000)
+
+
+def benchmark_dbx_with_ffi_transaction(n=10000, batch_size=2000):
+    """Benchmark DBX operations with batched FFI transactions of batch_size rows"""
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    values = list(map(b"value:%d".__mod__, range(n)))
+    
     db = Database.open_in_memory()
+    packed = []
     
     try:
-        # INSERT with FFI transaction
-        start = time.perf_counter()
-        tx = db._lib.dbx_begin_transaction(db._handle)
-        for i in range(n):
-            key = f"key:{i}".encode()
-            value = f"value:{i}".encode()
-            key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-            value_array = (ctypes.c_uint8 * len(value)).from_buffer_copy(value)
-            db._lib.dbx_transaction_insert(
-                tx,
-                b"bench",
-                key_array, len(key),
-                value_array, len(value)
+        # Bind FFI entry points to locals outside the timed regions
+        begin = db._lib.dbx_begin_transaction
+        insert_batch = db._lib.dbx_transaction_insert_batch
+        delete_batch = db._lib.dbx_transaction_delete_batch
+        commit = db._lib.dbx_transaction_commit
+        get = db._lib.dbx_get
+        free_value = db._lib.dbx_free_value
+        string_at = ctypes.string_at
+        
+        # INSERT with one batched FFI call + commit per batch_size rows; the
+        # packed key batches are kept for the DELETE phase
+        key_batches = None
+        def run_insert():
+            nonlocal key_batches
+            key_blob, key_ptrs, key_lens = pack_keyspace(keys)
+            value_blob, value_ptrs, value_lens = pack_keyspace(values)
+            packed.append((key_blob, key_ptrs, key_lens))
+            packed.append((value_blob, value_ptrs, value_lens))
+            key_batches = list(zip(
+                split_batches(key_ptrs, batch_size), split_batches(key_lens, batch_size)
+            ))
+            value_batches = zip(
+                split_batches(value_ptrs, batch_size), split_batches(value_lens, batch_size)
             )
-        db._lib.dbx_transaction_commit(tx)
-        insert_time = time.perf_counter() - start
+            for (kp, kl), (vp, vl) in zip(key_batches, value_batches):
+                tx = begin(db._handle)
+                insert_batch(tx, b"bench", kp, kl, vp, vl, len(kp))
+                commit(tx)
+        insert_time = time_once(run_insert)
         
-        # GET (no transaction needed)
-        start = time.perf_counter()
-        for i in range(n):
-            key = f"key:{i}".encode()
-            _ = db.get("bench", key)
-        get_time = time.perf_counter() - start
+        # GET (no transaction needed); keys are passed as bytes without a
+        # copy and the out-params are allocated once
+        handle = db._handle
+        out_value = ctypes.POINTER(ctypes.c_uint8)()
+        out_len = ctypes.c_size_t()
+        out_value_ref = ctypes.byref(out_value)
+        out_len_ref = ctypes.byref(out_len)
+        def run_get():
+            for key in keys:
+                if get(handle, b"bench", key, len(key), out_value_ref, out_len_ref) == 0:
+                    _ = string_at(out_value, out_len.value)
+                    free_value(out_value, out_len)
+        get_time = time_repeatable(run_get)
         
-        # DELETE with FFI transaction
-        start = time.perf_counter()
-        tx = db._lib.dbx_begin_transaction(db._handle)
-        for i in range(n):
-            key = f"key:{i}".encode()
-            key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-            db._lib.dbx_transaction_delete(
-                tx,
-                b"bench",
-                key_array, len(key)
-            )
-        db._lib.dbx_transaction_commit(tx)
-        delete_time = time.perf_counter() - start
+        # DELETE with FFI transactions (reuses the insert key batches)
+        def run_delete():
+            for kp, kl in key_batches:
+                tx = begin(db._handle)
+                delete_batch(tx, b"bench", kp, kl, len(kp))
+                commit(tx)
+        delete_time = time_once(run_delete)
         
         return insert_time, get_time, delete_time
     finally:
         db.close()
+        for _, ptrs, lens in packed:
+            ARRAY_POOL.release(ptrs)
+            ARRAY_POOL.release(lens)
 
 
 def benchmark_sqlite(n=10000, in_memory=True):
     """Benchmark SQLite operations"""
+    keys = list(map("key:%d".__mod__, range(n)))
+    values = list(map("value:%d".__mod__, range(n)))
+    
     db_path = ":memory:" if in_memory else "sqlite_bench.db"
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    tune_sqlite(conn, in_memory)
     cursor = conn.cursor()
     
     try:
-        cursor.execute("CREATE TABLE IF NOT EXISTS bench (key TEXT PRIMARY KEY, value TEXT)")
+        cursor.execute(CREATE_SQL)
+        execute = cursor.execute
+        fetchall = cursor.fetchall
         
         # INSERT
-        start = time.perf_counter()
-        conn.execute("BEGIN TRANSACTION")
-        for i in range(n):
-            key = f"key:{i}"
-            value = f"value:{i}"
-            cursor.execute("INSERT INTO bench (key, value) VALUES (?, ?)", (key, value))
-        conn.commit()
-        insert_time = time.perf_counter() - start
+        def run_insert():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(INSERT_SQL, zip(keys, values))
+            conn.commit()
+        insert_time = time_once(run_insert)
         
         # GET
-        start = time.perf_counter()
-        for i in range(n):
-            key = f"key:{i}"
-            cursor.execute("SELECT value FROM bench WHERE key = ?", (key,))
-            _ = cursor.fetchone()
-        get_time = time.perf_counter() - start
+        def run_get():
+            for i in range(0, n, GET_CHUNK_SIZE):
+                chunk = keys[i:i + GET_CHUNK_SIZE]
+                execute(select_in_sql(len(chunk)), chunk)
+                _ = fetchall()
+        get_time = time_repeatable(run_get)
         
         # DELETE
-        start = time.perf_counter()
-        conn.execute("BEGIN TRANSACTION")
-        for i in range(n):
-            key = f"key:{i}"
-            cursor.execute("DELETE FROM bench WHERE key = ?", (key,))
-        conn.commit()
-        delete_time = time.perf_counter() - start
+        def run_delete():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(DELETE_SQL, zip(keys))
+            conn.commit()
+        delete_time = time_once(run_delete)
         
         return insert_time, get_time, delete_time
     finally:
@@ -153,6 +183,15 @@ def main():
     else:
         print(f"DELETE: SQLite is {dbx_delete/sql_delete:.2f}x faster")
     
+    # Commit batch size sweep
+    print("\n" + "=" * 60)
+    print("Commit Batch Size Sweep (DBX):")
+    print("=" * 60)
+    for batch_size in BATCH_SIZES:
+        insert_time, _, delete_time = benchmark_dbx_with_ffi_transaction(n, batch_size=batch_size)
+        print(f"batch={batch_size:>6,}: INSERT {n/insert_time:>12,.0f} ops/sec, "
+              f"DELETE {n/delete_time:>12,.0f} ops/sec")
+    
     print("\n" + "=" * 60)
     print("Benchmark completed!")
     print("=" * 60)
@@ -5,7 +5,6 @@ Compares DBX Python bindings with SQLite (sqlite3 module).
 Uses transaction context manager for batching.
 """
 
-import time
 import sys
 import os
 import sqlite3
@@ -14,36 +13,42 @@ import sqlite3
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from dbx_py import Database
+from bench_utils import (
+    CREATE_SQL, DELETE_SQL, GET_CHUNK_SIZE, INSERT_SQL, select_in_sql,
+    time_once, time_repeatable, tune_sqlite,
+)
 
 
 def benchmark_dbx_with_transaction(n=10000):
     """Benchmark DBX operations with transaction"""
+    keys = list(map(b"key:%d".__mod__, range(n)))
+    values = list(map(b"value:%d".__mod__, range(n)))
+    
     db = Database.open_in_memory()
     
     try:
         # INSERT with transaction
-        start = time.perf_counter()
-        with db.transaction() as tx:
-            for i in range(n):
-                key = f"key:{i}".encode()
-                value = f"value:{i}".encode()
-                tx.insert("bench", key, value)
-        insert_time = time.perf_counter() - start
+        def run_insert():
+            with db.begin_transaction() as tx:
+                insert = tx.insert
+                for key, value in zip(keys, values):
+                    insert("bench", key, value)
+        insert_time = time_once(run_insert)
         
         # GET (no transaction needed)
-        start = time.perf_counter()
-        for i in range(n):
-            key = f"key:{i}".encode()
-            _ = db.get("bench", key)
-        get_time = time.perf_counter() - start
+        get = db.get
+        def run_get():
+            for key in keys:
+                _ = get("bench", key)
+        get_time = time_repeatable(run_get)
         
         # DELETE with transaction
-        start = time.perf_counter()
-        with db.transaction() as tx:
-            for i in range(n):
-                key = f"key:{i}".encode()
-                tx.delete("bench", key)
-        delete_time = time.perf_counter() - start
+        def run_delete():
+            with db.begin_transaction() as tx:
+                delete = tx.delete
+                for key in keys:
+                    delete("bench", key)
+        delete_time = time_once(run_delete)
         
         return insert_time, get_time, delete_time
     finally:
@@ -52,39 +57,40 @@ def benchmark_dbx_with_transaction(n=10000):
 
 def benchmark_sqlite(n=10000, in_memory=True):
     """Benchmark SQLite operations"""
+    keys = list(map("key:%d".__mod__, range(n)))
+    values = list(map("value:%d".__mod__, range(n)))
+    
     db_path = ":memory:" if in_memory else "sqlite_bench.db"
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, cached_statements=256)
+    tune_sqlite(conn, in_memory)
     cursor = conn.cursor()
     
     try:
-        cursor.execute("CREATE TABLE IF NOT EXISTS bench (key TEXT PRIMARY KEY, value TEXT)")
+        cursor.execute(CREATE_SQL)
+        execute = cursor.execute
+        fetchall = cursor.fetchall
         
         # INSERT
-        start = time.perf_counter()
-        conn.execute("BEGIN TRANSACTION")
-        for i in range(n):
-            key = f"key:{i}"
-            value = f"value:{i}"
-            cursor.execute("INSERT INTO bench (key, value) VALUES (?, ?)", (key, value))
-        conn.commit()
-        insert_time = time.perf_counter() - start
+        def run_insert():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(INSERT_SQL, zip(keys, values))
+            conn.commit()
+        insert_time = time_once(run_insert)
         
         # GET
-        start = time.perf_counter()
-        for i in range(n):
-            key = f"key:{i}"
-            cursor.execute("SELECT value FROM bench WHERE key = ?", (key,))
-            _ = cursor.fetchone()
-        get_time = time.perf_counter() - start
+        def run_get():
+            for i in range(0, n, GET_CHUNK_SIZE):
+                chunk = keys[i:i + GET_CHUNK_SIZE]
+                execute(select_in_sql(len(chunk)), chunk)
+                _ = fetchall()
+        get_time = time_repeatable(run_get)
         
         # DELETE
-        start = time.perf_counter()
-        conn.execute("BEGIN TRANSACTION")
-        for i in range(n):
-            key = f"key:{i}"
-            cursor.execute("DELETE FROM bench WHERE key = ?", (key,))
-        conn.commit()
-        delete_time = time.perf_counter() - start
+        def run_delete():
+            conn.execute("BEGIN TRANSACTION")
+            cursor.executemany(DELETE_SQL, zip(keys))
+            conn.commit()
+        delete_time = time_once(run_delete)
         
         return insert_time, get_time, delete_time
     finally:
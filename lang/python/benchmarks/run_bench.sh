@@ -0,0 +1,46 @@
+#!/bin/sh
+# Run a Python benchmark under the system allocator and again with
+# jemalloc preloaded, so allocator effects can be compared directly.
+#
+# Usage: ./run_bench.sh [benchmark.py]
+#        JEMALLOC=/path/to/libjemalloc.so ./run_bench.sh benchmark_crud.py
+
+set -e
+
+cd "$(dirname "$0")"
+
+BENCH="${1:-benchmark_vs_sqlite_ffi_tx.py}"
+PYTHON="${PYTHON:-python}"
+
+if [ -z "$JEMALLOC" ]; then
+    for candidate in \
+        /usr/lib/x86_64-linux-gnu/libjemalloc.so.2 \
+        /usr/lib/aarch64-linux-gnu/libjemalloc.so.2 \
+        /usr/lib64/libjemalloc.so.2 \
+        /usr/local/lib/libjemalloc.so.2 \
+        /usr/local/lib/libjemalloc.dylib \
+        /opt/homebrew/lib/libjemalloc.dylib; do
+        if [ -f "$candidate" ]; then
+            JEMALLOC="$candidate"
+            break
+        fi
+    done
+fi
+
+echo "### $BENCH (system malloc)"
+"$PYTHON" "$BENCH"
+
+if [ -z "$JEMALLOC" ]; then
+    echo "### jemalloc not found; set JEMALLOC=/path/to/libjemalloc to compare"
+    exit 0
+fi
+
+echo
+echo "### $BENCH (jemalloc: $JEMALLOC)"
+if [ "$(uname)" = "Darwin" ]; then
+    DYLD_INSERT_LIBRARIES="$JEMALLOC" "$PYTHON" "$BENCH"
+else
+    LD_PRELOAD="$JEMALLOC" \
+    MALLOC_CONF="background_thread:true,metadata_thp:auto" \
+        "$PYTHON" "$BENCH"
+fi
@@ -1,6 +1,6 @@
 """DBX - High-Performance Embedded Database for Python"""
 
-from .database import Database
+from .database import Database, Transaction
 
 __version__ = "0.0.1b1"
-__all__ = ["Database"]
+__all__ = ["Database", "Transaction"]
@@ -1,9 +1,42 @@
 """DBX Database wrapper for Python (ctypes FFI)"""
 
 import ctypes
+import os
 import platform
+import threading
+import weakref
+from array import array
+from itertools import accumulate
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Union
+
+
+# ctypes helpers called on every read, bound once at module level
+_byref = ctypes.byref
+_string_at = ctypes.string_at
+
+# Status codes from dbx.h that callers branch on rather than raise for
+_DBX_ERR_NOT_FOUND = -4
+_DBX_ERR_BUFFER_TOO_SMALL = -6
+
+# Upper bound on cached encoded table/column names per Database
+_NAME_CACHE_LIMIT = 1024
+
+# Initial and maximum size of the per-thread buffer get() reads values into
+_READ_BUFFER_SIZE = 4096
+_READ_BUFFER_MAX = 1 << 20
+
+# Free lists of scan chunk arrays keyed by power-of-two size, and how many
+# sets are kept per size once their iterators are closed
+_CHUNK_ARRAY_POOL: Dict[int, List[tuple]] = {}
+_CHUNK_ARRAY_POOL_DEPTH = 8
+
+# Key/value types accepted by the point operations; bytes is passed to the
+# library as-is, any other buffer is copied to bytes once per call
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Filesystem path types accepted wherever a database path is expected
+PathType = Union[str, bytes, os.PathLike]
 
 
 class Database:
@@ -15,96 +48,234 @@ class Database:
         >>> value = db.get("users", b"user:1")
         >>> print(value)
         b'Alice'
+
+    Call close() (or use the database as a context manager) to release
+    the native handle deterministically. A handle that is never closed is
+    released when the object is collected or at interpreter exit.
     """
+
+    __slots__ = (
+        '_handle', '_lib', '_name_cache', '_finalizer', '__weakref__',
+        # FFI functions bound once per instance by _attach()
+        '_dbx_close', '_dbx_insert', '_dbx_get', '_dbx_delete', '_dbx_free_value',
+        '_dbx_current_timestamp', '_dbx_allocate_commit_ts',
+        '_dbx_insert_versioned', '_dbx_get_snapshot', '_dbx_get_into',
+    )
     
-    def __init__(self, path: str):
+    def __init__(self, path: PathType):
         """Open a database at the given path"""
-        self._lib = self._load_library()
-        self._setup_functions()
+        self._handle = None
+        self._lib = _get_lib()
+        self._name_cache: Dict[str, bytes] = {}
         
-        path_bytes = path.encode('utf-8')
-        self._handle = self._lib.dbx_open(path_bytes)
+        path_bytes = os.fsencode(path)
+        handle = self._lib.dbx_open(path_bytes)
         
-        if not self._handle:
+        if not handle:
             raise RuntimeError(f"Failed to open database at {path}")
+        self._attach(handle)
     
     @classmethod
     def open_in_memory(cls) -> 'Database':
         """Open an in-memory database"""
         db = cls.__new__(cls)
-        db._lib = db._load_library()
-        db._setup_functions()
-        db._handle = db._lib.dbx_open_in_memory()
+        db._handle = None
+        db._lib = _get_lib()
+        db._name_cache = {}
+        handle = db._lib.dbx_open_in_memory()
         
-        if not db._handle:
+        if not handle:
             raise RuntimeError("Failed to open in-memory database")
+        db._attach(handle)
         
         return db
 
     @classmethod
-    def load_from_file(cls, path: str) -> 'Database':
+    def load_from_file(cls, path: PathType) -> 'Database':
         """Load a database from a snapshot file"""
         db = cls.__new__(cls)
-        db._lib = db._load_library()
-        db._setup_functions()
-        db._handle = db._lib.dbx_load_from_file(path.encode('utf-8'))
+        db._handle = None
+        db._lib = _get_lib()
+        db._name_cache = {}
+        handle = db._lib.dbx_load_from_file(os.fsencode(path))
 
-        if not db._handle:
+        if not handle:
             raise RuntimeError(f"Failed to load database from {path}")
+        db._attach(handle)
 
         return db
 
+    def _attach(self, handle: int) -> None:
+        """Take ownership of a native handle, closing it when collected"""
+        lib = self._lib
+        self._dbx_close = lib.dbx_close
+        self._dbx_insert = lib.dbx_insert
+        self._dbx_get = lib.dbx_get
+        self._dbx_delete = lib.dbx_delete
+        self._dbx_free_value = lib.dbx_free_value
+        self._dbx_current_timestamp = lib.dbx_current_timestamp
+        self._dbx_allocate_commit_ts = lib.dbx_allocate_commit_ts
+        self._dbx_insert_versioned = lib.dbx_insert_versioned
+        self._dbx_get_snapshot = lib.dbx_get_snapshot
+        self._dbx_get_into = lib.dbx_get_into
+
+        self._handle = handle
+        self._finalizer = weakref.finalize(self, self._dbx_close, handle)
+
+    def _encode_name(self, name: str) -> bytes:
+        """UTF-8 encode a table or column name, reusing earlier encodings"""
+        encoded = self._name_cache.get(name)
+        if encoded is None:
+            if len(self._name_cache) >= _NAME_CACHE_LIMIT:
+                self._name_cache.clear()
+            encoded = name.encode('utf-8')
+            self._name_cache[name] = encoded
+        return encoded
+
     # ═══════════════════════════════════════════════════
     # CRUD Operations
     # ═══════════════════════════════════════════════════
     
-    def insert(self, table: str, key: bytes, value: bytes) -> None:
+    def insert(self, table: str, key: BytesLike, value: BytesLike) -> None:
         """Insert a key-value pair into a table"""
-        table_bytes = table.encode('utf-8')
-        key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-        value_array = (ctypes.c_uint8 * len(value)).from_buffer_copy(value)
-        
-        result = self._lib.dbx_insert(
+        if type(key) is not bytes:
+            key = bytes(key)
+        if type(value) is not bytes:
+            value = bytes(value)
+        table_bytes = self._encode_name(table)
+
+        result = self._dbx_insert(
             self._handle, table_bytes,
-            key_array, len(key),
-            value_array, len(value)
+            key, len(key),
+            value, len(value)
         )
         
         if result != 0:
             raise RuntimeError(f"Insert failed with error code: {result}")
     
-    def get(self, table: str, key: bytes) -> Optional[bytes]:
+    def get(self, table: str, key: BytesLike) -> Optional[bytes]:
         """Get a value by key from a table"""
-        table_bytes = table.encode('utf-8')
-        key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-        out_value = ctypes.POINTER(ctypes.c_uint8)()
-        out_len = ctypes.c_size_t()
+        if type(key) is not bytes:
+            key = bytes(key)
+        table_bytes = self._encode_name(table)
+        _, out_len, _, out_len_ref = _out_scratch()
+        buf = _read_buffer()
+        
+        # Copy into the per-thread read buffer: one FFI call and no native
+        # allocation. Values too big for it are retried once with a larger
+        # buffer, or fetched through dbx_get past _READ_BUFFER_MAX or if they
+        # outgrow the retry too.
+        result = self._dbx_get_into(
+            self._handle, table_bytes,
+            key, len(key),
+            buf, len(buf), out_len_ref
+        )
+        if result == _DBX_ERR_BUFFER_TOO_SMALL:
+            if out_len.value > _READ_BUFFER_MAX:
+                return self._get_owned(table_bytes, key)
+            buf = _read_buffer(out_len.value)
+            result = self._dbx_get_into(
+                self._handle, table_bytes,
+                key, len(key),
+                buf, len(buf), out_len_ref
+            )
+            if result == _DBX_ERR_BUFFER_TOO_SMALL:
+                # A concurrent writer grew the value in between
+                return self._get_owned(table_bytes, key)
+        
+        if result == _DBX_ERR_NOT_FOUND:
+            return None
+        elif result != 0:
+            raise RuntimeError(f"Get failed with error code: {result}")
+        
+        return _string_at(buf, out_len.value)
+    
+    def _get_owned(self, table_bytes: bytes, key: bytes) -> Optional[bytes]:
+        """Get a value through a buffer allocated and freed by the library"""
+        out_value, out_len, out_value_ref, out_len_ref = _out_scratch()
         
-        result = self._lib.dbx_get(
+        result = self._dbx_get(
             self._handle, table_bytes,
-            key_array, len(key),
-            ctypes.byref(out_value), ctypes.byref(out_len)
+            key, len(key),
+            out_value_ref, out_len_ref
         )
         
-        if result == -4:  # DBX_ERR_NOT_FOUND
+        if result == _DBX_ERR_NOT_FOUND:
             return None
         elif result != 0:
             raise RuntimeError(f"Get failed with error code: {result}")
         
-        value = bytes(ctypes.cast(
-            out_value, ctypes.POINTER(ctypes.c_uint8 * out_len.value)
-        ).contents)
-        self._lib.dbx_free_value(out_value, out_len)
+        value = _string_at(out_value, out_len.value)
+        self._dbx_free_value(out_value, out_len)
         return value
     
-    def delete(self, table: str, key: bytes) -> None:
+    def get_view(self, table: str, key: BytesLike) -> Optional[memoryview]:
+        """Get a value as a read-only memoryview over the native buffer, without copying
+
+        The native buffer is freed once the view (and anything sliced or
+        cast from it) has been released or garbage collected.
+        """
+        if type(key) is not bytes:
+            key = bytes(key)
+        table_bytes = self._encode_name(table)
+        out_value, out_len, out_value_ref, out_len_ref = _out_scratch()
+
+        result = self._dbx_get(
+            self._handle, table_bytes,
+            key, len(key),
+            out_value_ref, out_len_ref
+        )
+
+        if result == _DBX_ERR_NOT_FOUND:
+            return None
+        elif result != 0:
+            raise RuntimeError(f"Get failed with error code: {result}")
+
+        # The scratch out-params are reused, so keep private copies for the finalizer
+        size = out_len.value
+        ptr = ctypes.cast(out_value, ctypes.POINTER(ctypes.c_uint8))
+        buf = (ctypes.c_char * size).from_address(ctypes.addressof(ptr.contents))
+        weakref.finalize(buf, self._dbx_free_value, ptr, size)
+        return memoryview(buf).cast('B').toreadonly()
+
+    def get_into(self, table: str, key: BytesLike, buf: bytearray) -> Optional[int]:
+        """Copy a value into a writable buffer; returns its length, or None if missing
+
+        Raises ValueError, without touching buf, if the value does not fit.
+        """
+        if type(key) is not bytes:
+            key = bytes(key)
+        table_bytes = self._encode_name(table)
+        _, out_len, _, out_len_ref = _out_scratch()
+        buf_cap = len(buf)
+
+        result = self._dbx_get_into(
+            self._handle, table_bytes,
+            key, len(key),
+            (ctypes.c_char * buf_cap).from_buffer(buf) if buf_cap else None,
+            buf_cap, out_len_ref
+        )
+
+        if result == _DBX_ERR_NOT_FOUND:
+            return None
+        elif result == _DBX_ERR_BUFFER_TOO_SMALL:
+            raise ValueError(
+                f"Buffer of {buf_cap} bytes is too small for a {out_len.value}-byte value"
+            )
+        elif result != 0:
+            raise RuntimeError(f"Get failed with error code: {result}")
+
+        return out_len.value
+    
+    def delete(self, table: str, key: BytesLike) -> None:
         """Delete a key from a table"""
-        table_bytes = table.encode('utf-8')
-        key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-        
-        result = self._lib.dbx_delete(
+        if type(key) is not bytes:
+            key = bytes(key)
+        table_bytes = self._encode_name(table)
+
+        result = self._dbx_delete(
             self._handle, table_bytes,
-            key_array, len(key)
+            key, len(key)
         )
         
         if result != 0:
@@ -114,65 +285,89 @@ class Database:
     # Batch Operations
     # ═══════════════════════════════════════════════════
 
+    def insert_many(self, table: str, keys: List[bytes], values: List[bytes]) -> None:
+        """Insert many key-value pairs with a single FFI call"""
+        if len(keys) != len(values):
+            raise ValueError("keys and values must have the same length")
+
+        table_bytes = self._encode_name(table)
+
+        result = self._lib.dbx_insert_many(
+            self._handle, table_bytes, len(keys),
+            _packed_offsets(keys), b"".join(keys),
+            _packed_offsets(values), b"".join(values)
+        )
+        if result != 0:
+            raise RuntimeError(f"Insert batch failed with error code: {result}")
+
+    def get_many(self, table: str, keys: List[bytes]) -> List[Optional[bytes]]:
+        """Get many values with a single FFI call; missing keys map to None"""
+        table_bytes = self._encode_name(table)
+        count = len(keys)
+        found = (ctypes.c_uint8 * count)()
+        out_result = ctypes.c_void_p()
+
+        result = self._lib.dbx_get_many(
+            self._handle, table_bytes, count,
+            _packed_offsets(keys), b"".join(keys),
+            found, _byref(out_result)
+        )
+        if result != 0:
+            raise RuntimeError(f"Get batch failed with error code: {result}")
+
+        it = ScanIterator(self._lib, out_result)
+        try:
+            values = (value for _, value in it)
+            return [next(values) if hit else None for hit in bytes(found)]
+        finally:
+            it.close()
+
     def scan(self, table: str) -> List[Tuple[bytes, bytes]]:
         """Scan all key-value pairs in a table"""
-        table_bytes = table.encode('utf-8')
+        return list(self.iter_scan(table))
+
+    def range(self, table: str, start_key: BytesLike, end_key: BytesLike) -> List[Tuple[bytes, bytes]]:
+        """Scan a range of keys [start_key, end_key)"""
+        return list(self.iter_range(table, start_key, end_key))
+
+    def iter_scan(self, table: str, views: bool = False) -> 'ScanIterator':
+        """Lazily iterate over all key-value pairs in a table
+
+        With views=True, keys and values are yielded as read-only
+        memoryviews into one shared buffer per chunk instead of bytes.
+        """
+        table_bytes = self._encode_name(table)
         out_result = ctypes.c_void_p()
 
         result = self._lib.dbx_scan(
-            self._handle, table_bytes, ctypes.byref(out_result)
+            self._handle, table_bytes, _byref(out_result)
         )
         if result != 0:
             raise RuntimeError(f"Scan failed with error code: {result}")
 
-        return self._read_scan_result(out_result)
-
-    def range(self, table: str, start_key: bytes, end_key: bytes) -> List[Tuple[bytes, bytes]]:
-        """Scan a range of keys [start_key, end_key)"""
-        table_bytes = table.encode('utf-8')
-        start_arr = (ctypes.c_uint8 * len(start_key)).from_buffer_copy(start_key)
-        end_arr = (ctypes.c_uint8 * len(end_key)).from_buffer_copy(end_key)
+        return (ScanViewIterator if views else ScanIterator)(self._lib, out_result)
+
+    def iter_range(
+        self, table: str, start_key: BytesLike, end_key: BytesLike, views: bool = False
+    ) -> 'ScanIterator':
+        """Lazily iterate over a range of keys [start_key, end_key); see iter_scan() for views"""
+        if type(start_key) is not bytes:
+            start_key = bytes(start_key)
+        if type(end_key) is not bytes:
+            end_key = bytes(end_key)
+        table_bytes = self._encode_name(table)
         out_result = ctypes.c_void_p()
 
         result = self._lib.dbx_range(
             self._handle, table_bytes,
-            start_arr, len(start_key),
-            end_arr, len(end_key),
-            ctypes.byref(out_result)
+            start_key, len(start_key),
+            end_key, len(end_key),
+            _byref(out_result)
         )
         if result != 0:
             raise RuntimeError(f"Range scan failed with error code: {result}")
 
-        return self._read_scan_result(out_result)
-
-    def _read_scan_result(self, scan_handle: ctypes.c_void_p) -> List[Tuple[bytes, bytes]]:
-        """Read entries from a scan result handle and free it"""
-        count = self._lib.dbx_scan_result_count(scan_handle)
-        entries = []
-
-        for i in range(count):
-            key_ptr = ctypes.POINTER(ctypes.c_uint8)()
-            key_len = ctypes.c_size_t()
-            val_ptr = ctypes.POINTER(ctypes.c_uint8)()
-            val_len = ctypes.c_size_t()
-
-            self._lib.dbx_scan_result_key(
-                scan_handle, i, ctypes.byref(key_ptr), ctypes.byref(key_len)
-            )
-            self._lib.dbx_scan_result_value(
-                scan_handle, i, ctypes.byref(val_ptr), ctypes.byref(val_len)
-            )
-
-            k = bytes(ctypes.cast(
-                key_ptr, ctypes.POINTER(ctypes.c_uint8 * key_len.value)
-            ).contents)
-            v = bytes(ctypes.cast(
-                val_ptr, ctypes.POINTER(ctypes.c_uint8 * val_len.value)
-            ).contents)
-            entries.append((k, v))
-
-        self._lib.dbx_scan_result_free(scan_handle)
-        return entries
+        return (ScanViewIterator if views else ScanIterator)(self._lib, out_result)
 
     # ═══════════════════════════════════════════════════
     # Utility Operations
@@ -180,11 +375,11 @@ class Database:
     
     def count(self, table: str) -> int:
         """Count rows in a table"""
-        table_bytes = table.encode('utf-8')
-        out_count = ctypes.c_size_t()
+        table_bytes = self._encode_name(table)
+        _, out_count, _, out_count_ref = _out_scratch()
         
         result = self._lib.dbx_count(
-            self._handle, table_bytes, ctypes.byref(out_count)
+            self._handle, table_bytes, out_count_ref
         )
         
         if result != 0:
@@ -201,30 +396,33 @@ class Database:
     def table_names(self) -> List[str]:
         """Get all table names"""
         out_list = ctypes.c_void_p()
-        result = self._lib.dbx_table_names(self._handle, ctypes.byref(out_list))
+        result = self._lib.dbx_table_names(self._handle, _byref(out_list))
         if result != 0:
             raise RuntimeError(f"Table names failed with error code: {result}")
 
-        count = self._lib.dbx_string_list_count(out_list)
-        names = []
-        for i in range(count):
-            str_ptr = ctypes.POINTER(ctypes.c_uint8)()
-            str_len = ctypes.c_size_t()
-            self._lib.dbx_string_list_get(
-                out_list, i, ctypes.byref(str_ptr), ctypes.byref(str_len)
+        try:
+            count = self._lib.dbx_string_list_count(out_list)
+            str_ptrs = (ctypes.c_void_p * count)()
+            str_lens = (ctypes.c_size_t * count)()
+            filled = ctypes.c_size_t()
+            result = self._lib.dbx_string_list_bulk(
+                out_list, 0, count, str_ptrs, str_lens, _byref(filled)
             )
-            name = bytes(ctypes.cast(
-                str_ptr, ctypes.POINTER(ctypes.c_uint8 * str_len.value)
-            ).contents).decode('utf-8')
-            names.append(name)
+            if result != 0:
+                raise RuntimeError(f"Table names failed with error code: {result}")
 
-        self._lib.dbx_string_list_free(out_list)
-        return names
+            n = filled.value
+            return [
+                name.decode('utf-8')
+                for name in map(_string_at, str_ptrs[:n], str_lens[:n])
+            ]
+        finally:
+            self._lib.dbx_string_list_free(out_list)
 
     def gc(self) -> int:
         """Run garbage collection"""
-        out_deleted = ctypes.c_size_t()
-        result = self._lib.dbx_gc(self._handle, ctypes.byref(out_deleted))
+        _, out_deleted, _, out_deleted_ref = _out_scratch()
+        result = self._lib.dbx_gc(self._handle, out_deleted_ref)
         if result != 0:
             raise RuntimeError(f"GC failed with error code: {result}")
         return out_deleted.value
@@ -240,9 +438,9 @@ class Database:
     def execute_sql(self, sql: str) -> int:
         """Execute a SQL statement (SELECT/INSERT/UPDATE/DELETE)"""
         sql_bytes = sql.encode('utf-8')
-        out_affected = ctypes.c_size_t()
+        _, out_affected, _, out_affected_ref = _out_scratch()
         result = self._lib.dbx_execute_sql(
-            self._handle, sql_bytes, ctypes.byref(out_affected)
+            self._handle, sql_bytes, out_affected_ref
         )
         if result != 0:
             raise RuntimeError(f"SQL execution failed with error code: {result}")
@@ -255,7 +453,7 @@ class Database:
     def create_index(self, table: str, column: str) -> None:
         """Create an index on a table column"""
         result = self._lib.dbx_create_index(
-            self._handle, table.encode('utf-8'), column.encode('utf-8')
+            self._handle, self._encode_name(table), self._encode_name(column)
         )
         if result != 0:
             raise RuntimeError(f"Create index failed with error code: {result}")
@@ -263,7 +461,7 @@ class Database:
     def drop_index(self, table: str, column: str) -> None:
         """Drop an index from a table column"""
         result = self._lib.dbx_drop_index(
-            self._handle, table.encode('utf-8'), column.encode('utf-8')
+            self._handle, self._encode_name(table), self._encode_name(column)
         )
         if result != 0:
             raise RuntimeError(f"Drop index failed with error code: {result}")
@@ -271,17 +469,17 @@ class Database:
     def has_index(self, table: str, column: str) -> bool:
         """Check if an index exists on a table column"""
         return self._lib.dbx_has_index(
-            self._handle, table.encode('utf-8'), column.encode('utf-8')
+            self._handle, self._encode_name(table), self._encode_name(column)
         ) != 0
 
     # ═══════════════════════════════════════════════════
     # Snapshot Operations
     # ═══════════════════════════════════════════════════
 
-    def save_to_file(self, path: str) -> None:
+    def save_to_file(self, path: PathType) -> None:
         """Save the database to a file"""
         result = self._lib.dbx_save_to_file(
-            self._handle, path.encode('utf-8')
+            self._handle, os.fsencode(path)
         )
         if result != 0:
             raise RuntimeError(f"Save failed with error code: {result}")
@@ -292,280 +490,684 @@ class Database:
 
     def current_timestamp(self) -> int:
         """Get the current MVCC timestamp"""
-        return self._lib.dbx_current_timestamp(self._handle)
+        return self._dbx_current_timestamp(self._handle)
 
     def allocate_commit_ts(self) -> int:
         """Allocate a new commit timestamp"""
-        return self._lib.dbx_allocate_commit_ts(self._handle)
+        return self._dbx_allocate_commit_ts(self._handle)
 
-    def insert_versioned(self, table: str, key: bytes, value: bytes, commit_ts: int) -> None:
+    def insert_versioned(self, table: str, key: BytesLike, value: BytesLike, commit_ts: int) -> None:
         """Insert a versioned key-value pair (MVCC)"""
-        table_bytes = table.encode('utf-8')
-        key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-        value_array = (ctypes.c_uint8 * len(value)).from_buffer_copy(value)
+        if type(key) is not bytes:
+            key = bytes(key)
+        if type(value) is not bytes:
+            value = bytes(value)
+        table_bytes = self._encode_name(table)
 
-        result = self._lib.dbx_insert_versioned(
+        result = self._dbx_insert_versioned(
             self._handle, table_bytes,
-            key_array, len(key),
-            value_array, len(value),
+            key, len(key),
+            value, len(value),
             commit_ts
         )
         if result != 0:
             raise RuntimeError(f"Versioned insert failed with error code: {result}")
 
-    def get_snapshot(self, table: str, key: bytes, read_ts: int) -> Optional[bytes]:
+    def get_snapshot(self, table: str, key: BytesLike, read_ts: int) -> Optional[bytes]:
         """Read a specific version of a key (Snapshot Read)"""
-        table_bytes = table.encode('utf-8')
-        key_array = (ctypes.c_uint8 * len(key)).from_buffer_copy(key)
-        out_value = ctypes.POINTER(ctypes.c_uint8)()
-        out_len = ctypes.c_size_t()
+        if type(key) is not bytes:
+            key = bytes(key)
+        table_bytes = self._encode_name(table)
+        out_value, out_len, out_value_ref, out_len_ref = _out_scratch()
 
-        result = self._lib.dbx_get_snapshot(
+        result = self._dbx_get_snapshot(
             self._handle, table_bytes,
-            key_array, len(key),
+            key, len(key),
             read_ts,
-            ctypes.byref(out_value), ctypes.byref(out_len)
+            out_value_ref, out_len_ref
         )
 
-        if result == -4:  # DBX_ERR_NOT_FOUND
+        if result == _DBX_ERR_NOT_FOUND:
             return None
         elif result != 0:
             raise RuntimeError(f"Snapshot read failed with error code: {result}")
 
-        value = bytes(ctypes.cast(
-            out_value, ctypes.POINTER(ctypes.c_uint8 * out_len.value)
-        ).contents)
-        self._lib.dbx_free_value(out_value, out_len)
+        value = _string_at(out_value, out_len.value)
+        self._dbx_free_value(out_value, out_len)
         return value
 
     # ═══════════════════════════════════════════════════
     # Transaction & Lifecycle
     # ═══════════════════════════════════════════════════
+
+    def begin_transaction(self) -> 'Transaction':
+        """Begin a transaction that buffers writes until commit"""
+        tx_handle = self._lib.dbx_begin_transaction(self._handle)
+        if not tx_handle:
+            raise RuntimeError("Failed to begin transaction")
+        return Transaction(self, tx_handle)
     
     def close(self) -> None:
-        """Close the database and free resources"""
-        if self._handle:
-            self._lib.dbx_close(self._handle)
+        """Close the database and free resources; safe to call repeatedly"""
+        # getattr: an instance made with __new__ alone never set its slots
+        if getattr(self, '_handle', None):
             self._handle = None
+            self._finalizer()
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
-    
-    def __del__(self):
-        self.close()
-    
-    # ═══════════════════════════════════════════════════
-    # Internal Library Loading
-    # ═══════════════════════════════════════════════════
 
-    def _load_library(self) -> ctypes.CDLL:
-        """Load the DBX shared library"""
-        system = platform.system()
-        if system == "Windows":
-            lib_name = "dbx_ffi.dll"
-        elif system == "Darwin":
-            lib_name = "libdbx_ffi.dylib"
+
+class Transaction:
+    """Buffered write transaction created by Database.begin_transaction()
+
+    Writes are queued in the native transaction and applied together on
+    commit(). Used as a context manager it commits on a clean exit and
+    rolls back if the block raises.
+
+    Example:
+        >>> with db.begin_transaction() as tx:
+        ...     tx.insert("users", b"user:1", b"Alice")
+        ...     tx.delete("users", b"user:0")
+    """
+
+    __slots__ = (
+        '_db', '_handle', '_finalizer', '__weakref__',
+        '_dbx_transaction_insert', '_dbx_transaction_delete',
+        '_dbx_transaction_commit',
+    )
+
+    def __init__(self, db: Database, tx_handle: int):
+        lib = db._lib
+        self._db = db
+        self._dbx_transaction_insert = lib.dbx_transaction_insert
+        self._dbx_transaction_delete = lib.dbx_transaction_delete
+        self._dbx_transaction_commit = lib.dbx_transaction_commit
+        self._handle = tx_handle
+        self._finalizer = weakref.finalize(
+            self, lib.dbx_transaction_rollback, tx_handle
+        )
+
+    def insert(self, table: str, key: BytesLike, value: BytesLike) -> None:
+        """Queue a key-value insert"""
+        if type(key) is not bytes:
+            key = bytes(key)
+        if type(value) is not bytes:
+            value = bytes(value)
+        result = self._dbx_transaction_insert(
+            self._handle, self._db._encode_name(table),
+            key, len(key),
+            value, len(value)
+        )
+        if result != 0:
+            raise RuntimeError(f"Transaction insert failed with error code: {result}")
+
+    def delete(self, table: str, key: BytesLike) -> None:
+        """Queue a key delete"""
+        if type(key) is not bytes:
+            key = bytes(key)
+        result = self._dbx_transaction_delete(
+            self._handle, self._db._encode_name(table),
+            key, len(key)
+        )
+        if result != 0:
+            raise RuntimeError(f"Transaction delete failed with error code: {result}")
+
+    def commit(self) -> None:
+        """Apply all queued writes; the transaction cannot be reused afterwards"""
+        if not self._handle:
+            raise RuntimeError("Transaction is already finished")
+        if not self._db._handle:
+            raise RuntimeError("Database is closed")
+
+        # dbx_transaction_commit frees the native transaction itself
+        tx_handle = self._handle
+        self._handle = None
+        self._finalizer.detach()
+        result = self._dbx_transaction_commit(tx_handle)
+        if result != 0:
+            raise RuntimeError(f"Transaction commit failed with error code: {result}")
+
+    def rollback(self) -> None:
+        """Discard all queued writes; safe to call repeatedly"""
+        if self._handle:
+            self._handle = None
+            self._finalizer()
+
+    def __enter__(self) -> 'Transaction':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
         else:
-            lib_name = "libdbx_ffi.so"
-        
-        search_paths = [
-            Path(__file__).parent.parent.parent.parent / "core" / "dbx-ffi" / "target" / "release" / lib_name,
-            Path(__file__).parent / lib_name,
-            lib_name,
-        ]
-        
-        for path in search_paths:
-            try:
-                return ctypes.CDLL(str(path))
-            except OSError:
-                continue
-        
-        raise RuntimeError(f"Could not find DBX library ({lib_name})")
-    
-    def _setup_functions(self) -> None:
-        """Setup function signatures"""
-        # Constructors
-        self._lib.dbx_open.argtypes = [ctypes.c_char_p]
-        self._lib.dbx_open.restype = ctypes.c_void_p
+            self.rollback()
 
-        self._lib.dbx_open_in_memory.argtypes = []
-        self._lib.dbx_open_in_memory.restype = ctypes.c_void_p
 
-        self._lib.dbx_load_from_file.argtypes = [ctypes.c_char_p]
-        self._lib.dbx_load_from_file.restype = ctypes.c_void_p
-        
-        # CRUD
-        self._lib.dbx_insert.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-        ]
-        self._lib.dbx_insert.restype = ctypes.c_int
-        
-        self._lib.dbx_get.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-            ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_get.restype = ctypes.c_int
-        
-        self._lib.dbx_delete.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-        ]
-        self._lib.dbx_delete.restype = ctypes.c_int
-
-        # Scan/Range
-        self._lib.dbx_scan.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p),
-        ]
-        self._lib.dbx_scan.restype = ctypes.c_int
-
-        self._lib.dbx_range.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.POINTER(ctypes.c_void_p),
-        ]
-        self._lib.dbx_range.restype = ctypes.c_int
-
-        self._lib.dbx_scan_result_count.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_scan_result_count.restype = ctypes.c_size_t
-
-        self._lib.dbx_scan_result_key.argtypes = [
-            ctypes.c_void_p, ctypes.c_size_t,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-            ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_scan_result_key.restype = ctypes.c_int
-
-        self._lib.dbx_scan_result_value.argtypes = [
-            ctypes.c_void_p, ctypes.c_size_t,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-            ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_scan_result_value.restype = ctypes.c_int
-
-        self._lib.dbx_scan_result_free.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_scan_result_free.restype = None
-        
-        # Utility
-        self._lib.dbx_count.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_count.restype = ctypes.c_int
-        
-        self._lib.dbx_flush.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_flush.restype = ctypes.c_int
-
-        self._lib.dbx_table_names.argtypes = [
-            ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p),
-        ]
-        self._lib.dbx_table_names.restype = ctypes.c_int
-
-        self._lib.dbx_string_list_count.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_string_list_count.restype = ctypes.c_size_t
-
-        self._lib.dbx_string_list_get.argtypes = [
-            ctypes.c_void_p, ctypes.c_size_t,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-            ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_string_list_get.restype = ctypes.c_int
-
-        self._lib.dbx_string_list_free.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_string_list_free.restype = None
-
-        self._lib.dbx_gc.argtypes = [
-            ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_gc.restype = ctypes.c_int
-
-        self._lib.dbx_is_encrypted.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_is_encrypted.restype = ctypes.c_int
-
-        # SQL
-        self._lib.dbx_execute_sql.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_execute_sql.restype = ctypes.c_int
-
-        # Index
-        self._lib.dbx_create_index.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
-        ]
-        self._lib.dbx_create_index.restype = ctypes.c_int
-
-        self._lib.dbx_drop_index.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
-        ]
-        self._lib.dbx_drop_index.restype = ctypes.c_int
-
-        self._lib.dbx_has_index.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
-        ]
-        self._lib.dbx_has_index.restype = ctypes.c_int
-
-        # Snapshot
-        self._lib.dbx_save_to_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        self._lib.dbx_save_to_file.restype = ctypes.c_int
-
-        # MVCC
-        self._lib.dbx_current_timestamp.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_current_timestamp.restype = ctypes.c_uint64
-
-        self._lib.dbx_allocate_commit_ts.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_allocate_commit_ts.restype = ctypes.c_uint64
-
-        self._lib.dbx_insert_versioned.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.c_uint64,
-        ]
-        self._lib.dbx_insert_versioned.restype = ctypes.c_int
-
-        self._lib.dbx_get_snapshot.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.c_uint64,
-            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
-            ctypes.POINTER(ctypes.c_size_t),
-        ]
-        self._lib.dbx_get_snapshot.restype = ctypes.c_int
-        
-        # Memory
-        self._lib.dbx_free_value.argtypes = [
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-        ]
-        self._lib.dbx_free_value.restype = None
-        
-        self._lib.dbx_close.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_close.restype = None
-        
-        # Transaction
-        self._lib.dbx_begin_transaction.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_begin_transaction.restype = ctypes.c_void_p
-        
-        self._lib.dbx_transaction_insert.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-        ]
-        self._lib.dbx_transaction_insert.restype = ctypes.c_int
-        
-        self._lib.dbx_transaction_delete.argtypes = [
-            ctypes.c_void_p, ctypes.c_char_p,
-            ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
-        ]
-        self._lib.dbx_transaction_delete.restype = ctypes.c_int
-        
-        self._lib.dbx_transaction_commit.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_transaction_commit.restype = ctypes.c_int
-        
-        self._lib.dbx_transaction_rollback.argtypes = [ctypes.c_void_p]
-        self._lib.dbx_transaction_rollback.restype = None
+class ScanIterator:
+    """Iterator over a native scan result, copying entries chunk by chunk
+
+    Entry pointers are fetched with one dbx_scan_result_bulk call per
+    chunk, so only a chunk's worth of entries is held as Python bytes at
+    a time. The native result handle is freed once the iterator is
+    exhausted, closed or garbage collected.
+    """
+
+    CHUNK_SIZE = 256
+
+    __slots__ = (
+        '_dbx_scan_result_bulk', '_scan_handle', '_finalizer', '_count',
+        '_index', '_pending', '_key_ptrs', '_key_lens', '_val_ptrs',
+        '_val_lens', '_filled', '_filled_ref', '__weakref__',
+    )
+
+    def __init__(self, lib: ctypes.CDLL, scan_handle: ctypes.c_void_p):
+        self._dbx_scan_result_bulk = lib.dbx_scan_result_bulk
+        self._scan_handle = scan_handle
+        self._finalizer = weakref.finalize(
+            self, lib.dbx_scan_result_free, scan_handle
+        )
+        self._count = lib.dbx_scan_result_count(scan_handle)
+        self._index = 0
+        self._pending: List[Tuple[bytes, bytes]] = []
+
+        (self._key_ptrs, self._key_lens, self._val_ptrs, self._val_lens,
+         self._filled) = _acquire_chunk_arrays(min(self._count, self.CHUNK_SIZE))
+        self._filled_ref = _byref(self._filled)
+
+    def __iter__(self) -> 'ScanIterator':
+        return self
+
+    def __next__(self) -> Tuple[bytes, bytes]:
+        if not self._pending and not self._fill():
+            self.close()
+            raise StopIteration
+        return self._pending.pop()
+
+    def __len__(self) -> int:
+        return self._count - self._index + len(self._pending)
+
+    def _fill(self) -> bool:
+        """Copy the next chunk of entries; returns False once exhausted"""
+        if self._scan_handle is None or self._index >= self._count:
+            return False
+
+        result = self._dbx_scan_result_bulk(
+            self._scan_handle, self._index, len(self._key_ptrs),
+            self._key_ptrs, self._key_lens,
+            self._val_ptrs, self._val_lens,
+            self._filled_ref
+        )
+        if result != 0:
+            raise RuntimeError(f"Scan read failed with error code: {result}")
+
+        n = self._filled.value
+        self._index += n
+        keys = map(_string_at, self._key_ptrs[:n], self._key_lens[:n])
+        values = map(_string_at, self._val_ptrs[:n], self._val_lens[:n])
+        self._pending = list(zip(keys, values))
+        self._pending.reverse()
+        return n > 0
+
+    def close(self) -> None:
+        """Free the native scan result and drop any entries not yet yielded"""
+        self._pending = []
+        self._index = self._count
+        if self._scan_handle:
+            self._scan_handle = None
+            self._finalizer()
+            _release_chunk_arrays((
+                self._key_ptrs, self._key_lens, self._val_ptrs,
+                self._val_lens, self._filled,
+            ))
+
+
+class ScanViewIterator(ScanIterator):
+    """Scan iterator yielding read-only memoryviews instead of bytes
+
+    Each chunk of entries is copied into one freshly allocated buffer with
+    a single dbx_scan_result_pack call, and the yielded keys and values are
+    slices of it. A chunk's buffer stays alive for as long as any view
+    into it does, independently of the iterator and the native result.
+    """
+
+    __slots__ = ('_dbx_scan_result_pack',)
+
+    def __init__(self, lib: ctypes.CDLL, scan_handle: ctypes.c_void_p):
+        super().__init__(lib, scan_handle)
+        self._dbx_scan_result_pack = lib.dbx_scan_result_pack
+
+    def _fill(self) -> bool:
+        """Pack the next chunk of entries into a new buffer; returns False once exhausted"""
+        if self._scan_handle is None or self._index >= self._count:
+            return False
+
+        # Fetch the chunk's lengths first so its buffer can be sized exactly
+        result = self._dbx_scan_result_bulk(
+            self._scan_handle, self._index, len(self._key_ptrs),
+            self._key_ptrs, self._key_lens,
+            self._val_ptrs, self._val_lens,
+            self._filled_ref
+        )
+        if result != 0:
+            raise RuntimeError(f"Scan read failed with error code: {result}")
+
+        n = self._filled.value
+        lens = self._key_lens[:n] + self._val_lens[:n]
+        total = sum(lens)
+        chunk = bytearray(total)
+
+        result = self._dbx_scan_result_pack(
+            self._scan_handle, self._index, n,
+            (ctypes.c_char * total).from_buffer(chunk) if total else None,
+            total, self._key_lens, self._val_lens, self._filled_ref
+        )
+        if result != 0:
+            raise RuntimeError(f"Scan read failed with error code: {result}")
+
+        self._index += n
+        view = memoryview(chunk).toreadonly()
+        bounds = list(accumulate(lens, initial=0))
+        views = list(map(view.__getitem__, map(slice, bounds, bounds[1:])))
+        self._pending = list(zip(views[:n], views[n:]))
+        self._pending.reverse()
+        return n > 0
+
+
+# ═══════════════════════════════════════════════════
+# Packing Helpers
+# ═══════════════════════════════════════════════════
+
+def _packed_offsets(items: List[bytes]) -> ctypes.Array:
+    """count + 1 ascending byte offsets of items laid out back to back"""
+    offsets = array('Q', accumulate(map(len, items), initial=0))
+    return (ctypes.c_uint64 * len(offsets)).from_buffer(offsets)
+
+
+def _acquire_chunk_arrays(size: int) -> tuple:
+    """Pointer/length arrays for a scan chunk, reused from the pool when possible
+
+    Sizes are rounded up to a power of two so scans of similar length
+    share arrays instead of allocating four fresh ones per iterator.
+    """
+    size_class = 1 << max(size - 1, 0).bit_length()
+    try:
+        return _CHUNK_ARRAY_POOL[size_class].pop()
+    except (KeyError, IndexError):
+        return (
+            (ctypes.c_void_p * size_class)(), (ctypes.c_size_t * size_class)(),
+            (ctypes.c_void_p * size_class)(), (ctypes.c_size_t * size_class)(),
+            ctypes.c_size_t(),
+        )
+
+
+def _release_chunk_arrays(arrays: tuple) -> None:
+    """Return a closed iterator's chunk arrays to the pool"""
+    free = _CHUNK_ARRAY_POOL.setdefault(len(arrays[0]), [])
+    if len(free) < _CHUNK_ARRAY_POOL_DEPTH:
+        free.append(arrays)
+
+
+# ═══════════════════════════════════════════════════
+# Per-thread Scratch
+# ═══════════════════════════════════════════════════
+
+_SCRATCH = threading.local()
+
+
+def _out_scratch() -> tuple:
+    """Reusable (out_ptr, out_len, byref(out_ptr), byref(out_len)) for this thread
+
+    Point reads and counters overwrite these out-params on every call and
+    read the result out before returning, so one set per thread is enough.
+    Keeping them thread-local lets a Database be shared across reader threads.
+    """
+    try:
+        return _SCRATCH.out
+    except AttributeError:
+        out_ptr = ctypes.POINTER(ctypes.c_uint8)()
+        out_len = ctypes.c_size_t()
+        _SCRATCH.out = (out_ptr, out_len, _byref(out_ptr), _byref(out_len))
+        return _SCRATCH.out
+
+
+def _read_buffer(min_size: int = 0) -> ctypes.Array:
+    """This thread's scratch buffer for get(), grown to at least min_size bytes"""
+    try:
+        buf = _SCRATCH.read_buf
+        if len(buf) >= min_size:
+            return buf
+    except AttributeError:
+        pass
+    size = max(_READ_BUFFER_SIZE, 1 << (min_size - 1).bit_length())
+    _SCRATCH.read_buf = ctypes.create_string_buffer(size)
+    return _SCRATCH.read_buf
+
+
+# ═══════════════════════════════════════════════════
+# Internal Library Loading
+# ═══════════════════════════════════════════════════
+
+_LIB: Optional[ctypes.CDLL] = None
+_LIB_LOCK = threading.Lock()
+
+
+def _get_lib() -> ctypes.CDLL:
+    """Return the shared DBX library, loading and configuring it on first use"""
+    global _LIB
+    if _LIB is None:
+        with _LIB_LOCK:
+            if _LIB is None:
+                lib = _load_library()
+                _setup_functions(lib)
+                _LIB = lib
+    return _LIB
+
+
+def _load_library() -> ctypes.CDLL:
+    """Load the DBX shared library"""
+    # Installed packages record the bundled library's name at build time
+    try:
+        from ._lib_path import LIB_NAME
+    except ImportError:
+        pass
+    else:
+        bundled = Path(__file__).parent / LIB_NAME
+        if bundled.exists():
+            return ctypes.CDLL(str(bundled))
+
+    system = platform.system()
+    if system == "Windows":
+        lib_name = "dbx_ffi.dll"
+    elif system == "Darwin":
+        lib_name = "libdbx_ffi.dylib"
+    else:
+        lib_name = "libdbx_ffi.so"
+
+    search_paths = [
+        Path(__file__).parent.parent.parent.parent / "core" / "dbx-ffi" / "target" / "release" / lib_name,
+        Path(__file__).parent / lib_name,
+        lib_name,
+    ]
+
+    # CDLL (unlike PyDLL) releases the GIL for the duration of every call,
+    # so reads and writes from several threads overlap inside the engine
+    for path in search_paths:
+        try:
+            return ctypes.CDLL(str(path))
+        except OSError:
+            continue
+
+    raise RuntimeError(f"Could not find DBX library ({lib_name})")
+
+
+def _setup_functions(lib: ctypes.CDLL) -> None:
+    """Setup function signatures"""
+    # Constructors
+    lib.dbx_open.argtypes = [ctypes.c_char_p]
+    lib.dbx_open.restype = ctypes.c_void_p
+
+    lib.dbx_open_in_memory.argtypes = []
+    lib.dbx_open_in_memory.restype = ctypes.c_void_p
+
+    lib.dbx_load_from_file.argtypes = [ctypes.c_char_p]
+    lib.dbx_load_from_file.restype = ctypes.c_void_p
+
+    # CRUD
+    lib.dbx_insert.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_char_p, ctypes.c_size_t,
+    ]
+    lib.dbx_insert.restype = ctypes.c_int
+
+    lib.dbx_get.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_get.restype = ctypes.c_int
+
+    lib.dbx_get_into.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_void_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_get_into.restype = ctypes.c_int
+
+    lib.dbx_delete.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+    ]
+    lib.dbx_delete.restype = ctypes.c_int
+
+    # Batch
+    lib.dbx_insert_batch.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_size_t,
+    ]
+    lib.dbx_insert_batch.restype = ctypes.c_int
+
+    lib.dbx_insert_many.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_uint64), ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_uint64), ctypes.c_char_p,
+    ]
+    lib.dbx_insert_many.restype = ctypes.c_int
+
+    lib.dbx_get_many.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_uint64), ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_uint8), ctypes.POINTER(ctypes.c_void_p),
+    ]
+    lib.dbx_get_many.restype = ctypes.c_int
+
+    lib.dbx_get_many_discard.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_get_many_discard.restype = ctypes.c_int
+
+    # Scan/Range
+    lib.dbx_scan.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p),
+    ]
+    lib.dbx_scan.restype = ctypes.c_int
+
+    lib.dbx_range.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_void_p),
+    ]
+    lib.dbx_range.restype = ctypes.c_int
+
+    lib.dbx_scan_result_count.argtypes = [ctypes.c_void_p]
+    lib.dbx_scan_result_count.restype = ctypes.c_size_t
+
+    lib.dbx_scan_result_key.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_scan_result_key.restype = ctypes.c_int
+
+    lib.dbx_scan_result_value.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_scan_result_value.restype = ctypes.c_int
+
+    lib.dbx_scan_result_bulk.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_scan_result_bulk.restype = ctypes.c_int
+
+    lib.dbx_scan_result_pack.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t,
+        ctypes.c_void_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_scan_result_pack.restype = ctypes.c_int
+
+    lib.dbx_scan_result_free.argtypes = [ctypes.c_void_p]
+    lib.dbx_scan_result_free.restype = None
+
+    # Utility
+    lib.dbx_count.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_count.restype = ctypes.c_int
+
+    lib.dbx_flush.argtypes = [ctypes.c_void_p]
+    lib.dbx_flush.restype = ctypes.c_int
+
+    lib.dbx_table_names.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p),
+    ]
+    lib.dbx_table_names.restype = ctypes.c_int
+
+    lib.dbx_string_list_count.argtypes = [ctypes.c_void_p]
+    lib.dbx_string_list_count.restype = ctypes.c_size_t
+
+    lib.dbx_string_list_get.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_string_list_get.restype = ctypes.c_int
+
+    lib.dbx_string_list_bulk.argtypes = [
+        ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_void_p),
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_string_list_bulk.restype = ctypes.c_int
+
+    lib.dbx_string_list_free.argtypes = [ctypes.c_void_p]
+    lib.dbx_string_list_free.restype = None
+
+    lib.dbx_gc.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_gc.restype = ctypes.c_int
+
+    lib.dbx_is_encrypted.argtypes = [ctypes.c_void_p]
+    lib.dbx_is_encrypted.restype = ctypes.c_int
+
+    # SQL
+    lib.dbx_execute_sql.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_execute_sql.restype = ctypes.c_int
+
+    # Index
+    lib.dbx_create_index.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+    ]
+    lib.dbx_create_index.restype = ctypes.c_int
+
+    lib.dbx_drop_index.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+    ]
+    lib.dbx_drop_index.restype = ctypes.c_int
+
+    lib.dbx_has_index.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p,
+    ]
+    lib.dbx_has_index.restype = ctypes.c_int
+
+    # Snapshot
+    lib.dbx_save_to_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.dbx_save_to_file.restype = ctypes.c_int
+
+    # MVCC
+    lib.dbx_current_timestamp.argtypes = [ctypes.c_void_p]
+    lib.dbx_current_timestamp.restype = ctypes.c_uint64
+
+    lib.dbx_allocate_commit_ts.argtypes = [ctypes.c_void_p]
+    lib.dbx_allocate_commit_ts.restype = ctypes.c_uint64
+
+    lib.dbx_insert_versioned.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_uint64,
+    ]
+    lib.dbx_insert_versioned.restype = ctypes.c_int
+
+    lib.dbx_get_snapshot.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_uint64,
+        ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.dbx_get_snapshot.restype = ctypes.c_int
+
+    # Memory
+    lib.dbx_free_value.argtypes = [
+        ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t,
+    ]
+    lib.dbx_free_value.restype = None
+
+    lib.dbx_close.argtypes = [ctypes.c_void_p]
+    lib.dbx_close.restype = None
+
+    lib.dbx_last_error.argtypes = []
+    lib.dbx_last_error.restype = ctypes.c_char_p
+
+    # Transaction
+    lib.dbx_begin_transaction.argtypes = [ctypes.c_void_p]
+    lib.dbx_begin_transaction.restype = ctypes.c_void_p
+
+    lib.dbx_transaction_insert.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+        ctypes.c_char_p, ctypes.c_size_t,
+    ]
+    lib.dbx_transaction_insert.restype = ctypes.c_int
+
+    lib.dbx_transaction_delete.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.c_char_p, ctypes.c_size_t,
+    ]
+    lib.dbx_transaction_delete.restype = ctypes.c_int
+
+    lib.dbx_transaction_insert_batch.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_size_t,
+    ]
+    lib.dbx_transaction_insert_batch.restype = ctypes.c_int
+
+    lib.dbx_transaction_delete_batch.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p,
+        ctypes.POINTER(ctypes.c_char_p), ctypes.POINTER(ctypes.c_size_t),
+        ctypes.c_size_t,
+    ]
+    lib.dbx_transaction_delete_batch.restype = ctypes.c_int
+
+    lib.dbx_transaction_commit.argtypes = [ctypes.c_void_p]
+    lib.dbx_transaction_commit.restype = ctypes.c_int
+
+    lib.dbx_transaction_rollback.argtypes = [ctypes.c_void_p]
+    lib.dbx_transaction_rollback.restype = None
@@ -7,6 +7,10 @@ This example demonstrates basic database operations using DBX Python bindings.
 from dbx_py import Database
 
 
+# Table name shared by every call; Database caches its encoded form
+USERS = "users"
+
+
 def main():
     # Open an in-memory database
     print("Opening in-memory database...")
@@ -16,37 +20,33 @@ def main():
     # db = Database("my_database.db")
     
     try:
-        # Insert some data
+        # Insert all rows with a single batched call
         print("\nInserting data...")
-        db.insert("users", b"user:1", b"Alice")
-        db.insert("users", b"user:2", b"Bob")
-        db.insert("users", b"user:3", b"Charlie")
+        keys = [b"user:1", b"user:2", b"user:3"]
+        db.insert_many(USERS, keys, [b"Alice", b"Bob", b"Charlie"])
         
-        # Get data
+        # Get data, again in one batched call
         print("\nRetrieving data...")
-        value = db.get("users", b"user:1")
-        if value:
-            print(f"user:1 = {value.decode('utf-8')}")
-        
-        value = db.get("users", b"user:2")
-        if value:
-            print(f"user:2 = {value.decode('utf-8')}")
+        for key, value in zip(keys[:2], db.get_many(USERS, keys[:2])):
+            if value:
+                print(f"{key.decode('utf-8')} = {value.decode('utf-8')}")
         
         # Count rows
-        count = db.count("users")
+        count = db.count(USERS)
         print(f"\nTotal users: {count}")
         
         # Delete a row
         print("\nDeleting user:2...")
-        db.delete("users", b"user:2")
+        with db.begin_transaction() as tx:
+            tx.delete(USERS, b"user:2")
         
         # Verify deletion
-        value = db.get("users", b"user:2")
+        value = db.get(USERS, b"user:2")
         if value is None:
             print("user:2 successfully deleted")
         
         # Count again
-        count = db.count("users")
+        count = db.count(USERS)
         print(f"Total users after deletion: {count}")
         
         # Flush to disk (if using file-based database)
@@ -8,11 +8,59 @@ from pathlib import Path
 from setuptools import setup
 from setuptools.command.build_py import build_py
 
+try:
+    from setuptools.command.bdist_wheel import bdist_wheel
+except ImportError:
+    try:
+        from wheel.bdist_wheel import bdist_wheel
+    except ImportError:
+        bdist_wheel = None
+
 
 class BuildRustExtension(build_py):
-    """Custom build command to compile Rust FFI library"""
+    """Custom build command to compile Rust FFI library
+    
+    Set DBX_USE_PREBUILT=1 to skip cargo and package a library that was
+    already placed in dbx_py/ (e.g. by a CI job that built it once).
+    """
     
     def run(self):
+        package_dir = Path(__file__).parent / "dbx_py"
+        
+        # Determine library name based on platform
+        if sys.platform == "win32":
+            lib_name = "dbx_ffi.dll"
+        elif sys.platform == "darwin":
+            lib_name = "libdbx_ffi.dylib"
+        else:
+            lib_name = "libdbx_ffi.so"
+        
+        dst_lib = package_dir / lib_name
+        
+        if os.environ.get("DBX_USE_PREBUILT") == "1":
+            if not dst_lib.exists():
+                print(f"Error: DBX_USE_PREBUILT is set but {dst_lib} is missing", file=sys.stderr)
+                sys.exit(1)
+            print(f"Using prebuilt library {dst_lib}")
+        else:
+            self._build_and_copy(dst_lib)
+        
+        # Continue with normal build
+        super().run()
+        
+        if dst_lib.exists():
+            # Record the bundled library so installed packages load it without
+            # probing; only the build tree gets this, so source checkouts keep
+            # searching for a freshly built library
+            build_package_dir = Path(self.build_lib) / "dbx_py"
+            build_package_dir.mkdir(parents=True, exist_ok=True)
+            (build_package_dir / "_lib_path.py").write_text(
+                '"""Generated by setup.py: the DBX library bundled with this package"""\n'
+                "\n"
+                f"LIB_NAME = {lib_name!r}\n"
+            )
+    
+    def _build_and_copy(self, dst_lib):
         # Build the Rust FFI library
         rust_project_root = Path(__file__).parent.parent.parent
         
@@ -27,19 +75,7 @@ class BuildRustExtension(build_py):
             sys.exit(1)
         
         # Copy the built library to the package directory
-        target_dir = rust_project_root / "target" / "release"
-        package_dir = Path(__file__).parent / "dbx_py"
-        
-        # Determine library name based on platform
-        if sys.platform == "win32":
-            lib_name = "dbx_ffi.dll"
-        elif sys.platform == "darwin":
-            lib_name = "libdbx_ffi.dylib"
-        else:
-            lib_name = "libdbx_ffi.so"
-        
-        src_lib = target_dir / lib_name
-        dst_lib = package_dir / lib_name
+        src_lib = rust_project_root / "target" / "release" / dst_lib.name
         
         if src_lib.exists():
             print(f"Copying {src_lib} to {dst_lib}")
@@ -47,15 +83,33 @@ class BuildRustExtension(build_py):
             shutil.copy2(src_lib, dst_lib)
         else:
             print(f"Warning: Library not found at {src_lib}", file=sys.stderr)
+
+
+cmdclass = {
+    'build_py': BuildRustExtension,
+}
+
+if bdist_wheel is not None:
+    class PlatformWheel(bdist_wheel):
+        """Tag wheels py3-none-<platform>
         
-        # Continue with normal build
-        super().run()
+        The bindings are pure ctypes and work on any Python 3, but the
+        bundled library only runs on the platform it was built for.
+        """
+        
+        def finalize_options(self):
+            super().finalize_options()
+            self.root_is_pure = False
+        
+        def get_tag(self):
+            _, _, plat = super().get_tag()
+            return "py3", "none", plat
+    
+    cmdclass['bdist_wheel'] = PlatformWheel
 
 
 setup(
-    cmdclass={
-        'build_py': BuildRustExtension,
-    },
+    cmdclass=cmdclass,
     package_data={
         'dbx_py': ['*.dll', '*.so', '*.dylib'],
     },
@@ -0,0 +1,229 @@
+"""
+Behavior tests for the DBX Python bindings
+
+Run from lang/python with: python -m unittest test_database
+"""
+
+import gc
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from dbx_py import Database
+
+
+class DatabaseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.db = Database.open_in_memory()
+
+    def tearDown(self):
+        self.db.close()
+
+
+class TestPointReads(DatabaseTestCase):
+    def test_get_grows_past_the_read_buffer(self):
+        small, large = b"x" * 10, bytes(range(256)) * 64
+        self.db.insert("t", b"small", small)
+        self.db.insert("t", b"large", large)
+        self.db.insert("t", b"empty", b"")
+        self.assertEqual(self.db.get("t", b"large"), large)
+        self.assertEqual(self.db.get("t", b"small"), small)
+        self.assertEqual(self.db.get("t", b"empty"), b"")
+        self.assertIsNone(self.db.get("t", b"missing"))
+
+    def test_get_into(self):
+        self.db.insert("t", b"k", b"value")
+        buf = bytearray(16)
+        self.assertEqual(self.db.get_into("t", b"k", buf), 5)
+        self.assertEqual(buf[:5], b"value")
+        self.assertIsNone(self.db.get_into("t", b"missing", buf))
+
+    def test_get_into_empty_value(self):
+        self.db.insert("t", b"empty", b"")
+        self.assertEqual(self.db.get_into("t", b"empty", bytearray()), 0)
+        buf = bytearray(b"abc")
+        self.assertEqual(self.db.get_into("t", b"empty", buf), 0)
+        self.assertEqual(buf, b"abc")
+
+    def test_get_into_too_small_leaves_buffer_untouched(self):
+        self.db.insert("t", b"k", b"value")
+        buf = bytearray(b"abc")
+        with self.assertRaises(ValueError):
+            self.db.get_into("t", b"k", buf)
+        self.assertEqual(buf, b"abc")
+        with self.assertRaises(ValueError):
+            self.db.get_into("t", b"k", bytearray())
+
+    def test_get_view_outlives_overwrite_and_close(self):
+        self.db.insert("t", b"k", b"before")
+        self.assertIsNone(self.db.get_view("t", b"missing"))
+        view = self.db.get_view("t", b"k")
+        self.assertTrue(view.readonly)
+        self.db.insert("t", b"k", b"after")
+        self.db.close()
+        part = view[1:4]
+        del view
+        gc.collect()
+        self.assertEqual(bytes(part), b"efo")
+
+
+class TestBatchOperations(DatabaseTestCase):
+    def test_insert_many_and_get_many(self):
+        keys = [b"k%d" % i for i in range(600)]
+        values = [b"v%d" % i for i in range(600)]
+        self.db.insert_many("t", keys, values)
+        self.assertEqual(self.db.count("t"), 600)
+        self.assertEqual(self.db.get_many("t", keys), values)
+
+    def test_get_many_maps_missing_keys_to_none(self):
+        self.db.insert_many("t", [b"a", b"c"], [b"1", b""])
+        self.assertEqual(
+            self.db.get_many("t", [b"x", b"a", b"b", b"c", b"a"]),
+            [None, b"1", None, b"", b"1"],
+        )
+        self.assertEqual(self.db.get_many("t", []), [])
+        self.assertEqual(self.db.get_many("missing", [b"a"]), [None])
+
+    def test_insert_many_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.db.insert_many("t", [b"a", b"b"], [b"1"])
+        self.assertEqual(self.db.count("t"), 0)
+
+    def test_table_names(self):
+        self.db.insert("users", b"u1", b"Alice")
+        self.db.insert("orders", b"o1", b"42")
+        names = self.db.table_names()
+        self.assertTrue(all(isinstance(name, str) for name in names))
+        self.assertEqual(sorted(names), ["orders", "users"])
+
+
+class TestTransaction(DatabaseTestCase):
+    def test_commit_applies_queued_writes(self):
+        self.db.insert("t", b"old", b"0")
+        tx = self.db.begin_transaction()
+        tx.insert("t", b"new", b"1")
+        tx.delete("t", b"old")
+        self.assertIsNone(self.db.get("t", b"new"))
+        tx.commit()
+        self.assertEqual(self.db.get("t", b"new"), b"1")
+        self.assertIsNone(self.db.get("t", b"old"))
+
+    def test_rollback_discards_queued_writes(self):
+        tx = self.db.begin_transaction()
+        tx.insert("t", b"k", b"v")
+        tx.rollback()
+        tx.rollback()
+        self.assertIsNone(self.db.get("t", b"k"))
+
+    def test_finished_transaction_cannot_commit(self):
+        tx = self.db.begin_transaction()
+        tx.commit()
+        with self.assertRaises(RuntimeError):
+            tx.commit()
+        tx = self.db.begin_transaction()
+        tx.rollback()
+        with self.assertRaises(RuntimeError):
+            tx.commit()
+
+    def test_context_manager_rolls_back_on_error(self):
+        with self.assertRaises(KeyError):
+            with self.db.begin_transaction() as tx:
+                tx.insert("t", b"k", b"v")
+                raise KeyError("boom")
+        self.assertIsNone(self.db.get("t", b"k"))
+
+        with self.db.begin_transaction() as tx:
+            tx.insert("t", b"k", b"v")
+        self.assertEqual(self.db.get("t", b"k"), b"v")
+
+
+class TestBufferInputs(DatabaseTestCase):
+    def test_point_operations_accept_any_buffer(self):
+        for key, value in (
+            (bytearray(b"k1"), bytearray(b"v1")),
+            (memoryview(b"k2"), memoryview(b"v2")),
+            (memoryview(bytearray(b"xk3x"))[1:3], b"v3"),
+        ):
+            self.db.insert("t", key, value)
+            self.assertEqual(self.db.get("t", key), bytes(value))
+            self.assertEqual(self.db.get("t", bytes(key)), bytes(value))
+
+        self.assertEqual(self.db.get("t", b"k3"), b"v3")
+        self.db.delete("t", bytearray(b"k1"))
+        self.assertIsNone(self.db.get("t", b"k1"))
+
+    def test_range_bounds_accept_any_buffer(self):
+        for i in range(5):
+            self.db.insert("t", b"k%d" % i, b"v%d" % i)
+        rows = self.db.range("t", bytearray(b"k1"), memoryview(b"k3"))
+        self.assertEqual(rows, [(b"k1", b"v1"), (b"k2", b"v2")])
+
+    def test_transaction_accepts_any_buffer(self):
+        with self.db.begin_transaction() as tx:
+            tx.insert("t", bytearray(b"a"), memoryview(b"1"))
+            tx.insert("t", b"b", b"2")
+            tx.delete("t", memoryview(b"b"))
+        self.assertEqual(self.db.get("t", b"a"), b"1")
+        self.assertIsNone(self.db.get("t", b"b"))
+
+    def test_non_buffer_key_is_rejected(self):
+        with self.assertRaises(TypeError):
+            self.db.insert("t", "key", b"value")
+
+
+class TestScanIterator(DatabaseTestCase):
+    def test_close_drops_buffered_entries(self):
+        for i in range(10):
+            self.db.insert("t", b"k%d" % i, b"v")
+        it = self.db.iter_scan("t")
+        self.assertEqual(len(it), 10)
+        next(it)
+        it.close()
+        self.assertEqual(len(it), 0)
+        self.assertEqual(list(it), [])
+        it.close()
+
+    def test_scan_and_range(self):
+        rows = [(b"k%03d" % i, b"v%d" % i) for i in range(600)]
+        for key, value in rows:
+            self.db.insert("t", key, value)
+        self.assertEqual(sorted(self.db.scan("t")), rows)
+        self.assertEqual(
+            sorted(self.db.range("t", b"k010", b"k013")), rows[10:13]
+        )
+        self.assertEqual(self.db.scan("missing"), [])
+
+    def test_views_match_bytes_scan(self):
+        rows = [(b"k%03d" % i, b"v" * (i % 5)) for i in range(600)]
+        for key, value in rows:
+            self.db.insert("t", key, value)
+
+        it = self.db.iter_scan("t", views=True)
+        self.assertEqual(len(it), 600)
+        scanned = list(it)
+        self.assertTrue(all(
+            isinstance(k, memoryview) and k.readonly and v.readonly
+            for k, v in scanned
+        ))
+        self.assertEqual(sorted((bytes(k), bytes(v)) for k, v in scanned), rows)
+
+        ranged = self.db.iter_range("t", b"k100", b"k102", views=True)
+        self.assertEqual(
+            sorted((bytes(k), bytes(v)) for k, v in ranged), rows[100:102]
+        )
+
+    def test_views_outlive_the_iterator(self):
+        self.db.insert("t", b"k", b"v")
+        it = self.db.iter_scan("t", views=True)
+        key, value = next(it)
+        it.close()
+        del it
+        gc.collect()
+        self.assertEqual((bytes(key), bytes(value)), (b"k", b"v"))
+
+
+if __name__ == "__main__":
+    unittest.main()
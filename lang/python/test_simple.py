@@ -11,12 +11,19 @@ try:
     db = Database.open_in_memory()
     print("✓ Database opened")
     
-    db.insert("test", b"key1", b"value1")
+    table = "test"
+    with db.begin_transaction() as tx:
+        tx.insert(table, b"key1", b"value1")
+        tx.insert(table, b"key2", b"value2")
     print("✓ Insert successful")
     
-    value = db.get("test", b"key1")
+    value = db.get(table, b"key1")
     print(f"✓ Get successful: {value}")
     
+    values = db.get_many(table, [b"key1", b"key2", b"missing"])
+    assert values == [b"value1", b"value2", None], values
+    print(f"✓ Batched get successful: {values}")
+    
     db.close()
     print("✓ All tests passed!")
     